@@ -130,7 +130,7 @@ class DocList(
         self,
         docs: Optional[Iterable[T_doc]] = None,
     ):
-        self._data: List[T_doc] = list(self._validate_docs(docs)) if docs else []
+        self._data: List[T_doc] = self._validate_docs(docs) if docs else []
 
     @classmethod
     def construct(
@@ -155,12 +155,18 @@ class DocList(
                 return False
         return True
 
-    def _validate_docs(self, docs: Iterable[T_doc]) -> Iterable[T_doc]:
+    def _validate_docs(self, docs: Iterable[T_doc]) -> List[T_doc]:
         """
         Validate if an Iterable of Document are compatible with this `DocList`
+        :return: a new list holding the Documents
         """
-        for doc in docs:
-            yield self._validate_one_doc(doc)
+        docs_list = list(docs)
+        if not issubclass(self.doc_type, AnyDoc):
+            doc_type = self.doc_type
+            for doc in docs_list:
+                if not isinstance(doc, doc_type):
+                    raise ValueError(f'{doc} is not a {doc_type}')
+        return docs_list
 
     def _validate_one_doc(self, doc: T_doc) -> T_doc:
         """Validate if a Document is compatible with this `DocList`"""
@@ -101,10 +101,8 @@ class IndexingSequenceMixin(Iterable[T_item]):
         return item
 
     def _get_from_indices(self: T, item: Iterable[int]) -> T:
-        results = []
-        for ix in item:
-            results.append(self._data[ix])
-        return self.__class__(results)
+        data = self._data
+        return self.__class__([data[ix] for ix in item])
 
     def _set_by_indices(self: T, item: Iterable[int], value: Iterable[T_item]):
         for ix, doc_to_set in zip(item, value):
@@ -11,6 +11,16 @@ TTensorRetrieval = TypeVar('TTensorRetrieval')
 TTensorMetrics = TypeVar('TTensorMetrics')
 
 
+def _default_tile_size(n_queries: int) -> int:
+    """Number of index rows to score at once in the fused `<metric>_topk` metrics.
+
+    Keeps a tile of (n_queries, tile_size) scores at about 2**18 values, so it
+    stays in cache, while tiles do not get so thin or so large that the per-tile
+    matmul and top k calls become inefficient.
+    """
+    return min(max(2**18 // max(n_queries, 1), 4096), 65536)
+
+
 class AbstractComputationalBackend(ABC, typing.Generic[TTensor]):
     """
     Abstract base class for computational backends.
@@ -263,3 +273,14 @@ class AbstractComputationalBackend(ABC, typing.Generic[TTensor]):
                 x_mat[i_x] and y_mat[i_y].
             """
             ...
+
+        @staticmethod
+        @abstractmethod
+        def l2_norm(x_mat: 'TTensorMetrics') -> 'TTensorMetrics':
+            """L2 norms of the rows of a matrix.
+
+            :param x_mat: tensor of shape (n_vectors, n_dim), where n_vectors is the
+                number of vectors and n_dim is the number of dimensions of each example.
+            :return: Tensor of shape (n_vectors,) containing the norm of every row.
+            """
+            ...
@@ -1,9 +1,10 @@
 import warnings
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple, cast
 
 import numpy as np
 
 from docarray.computation import AbstractComputationalBackend
+from docarray.computation.abstract_comp_backend import _default_tile_size
 from docarray.computation.abstract_numpy_based_backend import AbstractNumpyBasedBackend
 
 
@@ -30,6 +31,45 @@ def _expand_if_scalar(arr: np.ndarray) -> np.ndarray:
     return arr
 
 
+def _tiled_top_k(
+    score_tile: Callable[[slice], np.ndarray],
+    n_y: int,
+    k: int,
+    descending: bool,
+    tile_size: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Retrieve the top k scores per query, computing the scores tile by tile.
+
+    :param score_tile: computes the (n_queries, tile) score matrix for the rows of
+        y_mat selected by the given slice
+    :param n_y: number of rows of y_mat
+    :param k: number of values to retrieve per query
+    :param descending: retrieve largest scores instead of smallest
+    :param tile_size: number of rows of y_mat to score at once
+    :return: Tuple containing the retrieved scores, and their indices in y_mat
+    """
+    top_k = NumpyCompBackend.Retrieval.top_k
+
+    top_vals: Optional[np.ndarray] = None
+    top_idx: Optional[np.ndarray] = None
+    for start in range(0, n_y, tile_size):
+        vals, idx = top_k(
+            score_tile(slice(start, start + tile_size)), k=k, descending=descending
+        )
+        idx = idx + start
+        if top_vals is not None and top_idx is not None:
+            # merge the tile candidates with the running top k
+            vals, pos = top_k(
+                np.concatenate([top_vals, vals], axis=1), k=k, descending=descending
+            )
+            idx = np.take_along_axis(
+                np.concatenate([top_idx, idx], axis=1), pos, axis=1
+            )
+        top_vals, top_idx = vals, idx
+
+    return cast(np.ndarray, top_vals), cast(np.ndarray, top_idx)
+
+
 def identity(array: np.ndarray) -> np.ndarray:
     return array
 
@@ -194,18 +234,192 @@ class NumpyCompBackend(AbstractNumpyBasedBackend):
 
             x_mat, y_mat = _expand_if_single_axis(x_mat, y_mat)
 
-            sims = np.clip(
-                (np.dot(x_mat, y_mat.T) + eps)
-                / (
-                    np.outer(
-                        np.linalg.norm(x_mat, axis=1), np.linalg.norm(y_mat, axis=1)
-                    )
-                    + eps
-                ),
-                -1,
-                1,
-            ).squeeze()
-            return _expand_if_scalar(sims)
+            sims = np.dot(x_mat, y_mat.T)
+            if not np.issubdtype(sims.dtype, np.inexact):
+                sims = sims.astype(np.float64)
+            denom = np.outer(
+                np.linalg.norm(x_mat, axis=1), np.linalg.norm(y_mat, axis=1)
+            )
+            # finalize in place, the (n_x, n_y) matrix is only allocated twice
+            sims += eps
+            denom += eps
+            np.divide(sims, denom, out=sims)
+            np.clip(sims, -1, 1, out=sims)
+            return _expand_if_scalar(sims.squeeze())
+
+        @staticmethod
+        def l2_norm(x_mat: np.ndarray) -> np.ndarray:
+            """L2 norms of the rows of a matrix.
+
+            :param x_mat: np.ndarray of shape (n_vectors, n_dim)
+            :return: np.ndarray of shape (n_vectors,)
+            """
+            return np.linalg.norm(x_mat, axis=-1)
+
+        @staticmethod
+        def cosine_sim_topk(
+            x_mat: np.ndarray,
+            y_mat: np.ndarray,
+            k: int,
+            descending: bool = True,
+            eps: float = 1e-7,
+            device: Optional[str] = None,
+            tile_size: Optional[int] = None,
+            score_dtype: Optional[Any] = None,
+            y_norms: Optional[np.ndarray] = None,
+        ) -> Tuple[np.ndarray, np.ndarray]:
+            """Retrieve, for every vector in x_mat, the k vectors in y_mat with the
+            highest cosine similarity.
+
+            This fuses `cosine_sim` and `Retrieval.top_k`: y_mat is processed in
+            tiles of `tile_size` rows, and only a running top k per query is kept,
+            so the full (n_x, n_y) similarity matrix is never materialized.
+
+            :param x_mat: np.ndarray of shape (n_vectors, n_dim), the queries
+            :param y_mat: np.ndarray of shape (n_vectors, n_dim), the vectors to
+                search
+            :param k: number of values to retrieve per query
+            :param descending: retrieve largest similarities instead of smallest
+            :param eps: a small jitter to avoid divde by zero
+            :param device: Not supported for this backend
+            :param tile_size: number of rows of y_mat to process at once. Per
+                default, chosen from the number of queries.
+            :param score_dtype: dtype used for the similarity matmul. Per default,
+                the dtype of the inputs. The returned similarities always have the
+                dtype of x_mat.
+            :param y_norms: precomputed L2 norms of the rows of y_mat, see `l2_norm`.
+                If not provided, they are computed on the fly.
+            :return: Tuple containing the retrieved similarities, and their indices
+                in y_mat. Both are of shape (n_queries, k)
+            """
+            if device is not None:
+                warnings.warn('`device` is not supported for numpy operations')
+
+            x_mat, y_mat = _expand_if_single_axis(x_mat, y_mat)
+            out_dtype = x_mat.dtype
+            x_score = x_mat if score_dtype is None else x_mat.astype(score_dtype)
+
+            # the query norms are computed once, every tile is then a single matmul
+            x_norm = np.linalg.norm(x_mat, axis=1)
+
+            if y_norms is None:
+                y_norms = np.linalg.norm(y_mat, axis=1)
+
+            def score_tile(rows: slice) -> np.ndarray:
+                tile = y_mat[rows]
+                if score_dtype is None:
+                    dots = np.dot(x_mat, tile.T)
+                else:
+                    dots = np.dot(x_score, tile.astype(score_dtype).T)
+                    dots = dots.astype(out_dtype)
+                if not np.issubdtype(dots.dtype, np.inexact):
+                    dots = dots.astype(np.float64)
+                denom = np.outer(x_norm, y_norms[rows])
+                # finalize in place, no temporaries of the tile size are allocated
+                dots += eps
+                denom += eps
+                np.divide(dots, denom, out=dots)
+                return np.clip(dots, -1, 1, out=dots)
+
+            if tile_size is None:
+                tile_size = _default_tile_size(x_mat.shape[0])
+            return _tiled_top_k(score_tile, y_mat.shape[0], k, descending, tile_size)
+
+        @staticmethod
+        def sqeuclidean_dist_topk(
+            x_mat: np.ndarray,
+            y_mat: np.ndarray,
+            k: int,
+            descending: bool = False,
+            device: Optional[str] = None,
+            tile_size: Optional[int] = None,
+            score_dtype: Optional[Any] = None,
+            y_norms: Optional[np.ndarray] = None,
+        ) -> Tuple[np.ndarray, np.ndarray]:
+            """Retrieve, for every vector in x_mat, the k vectors in y_mat with the
+            smallest squared euclidean distance.
+
+            This fuses `sqeuclidean_dist` and `Retrieval.top_k` like
+            `cosine_sim_topk` does: every tile of y_mat is scored with a single
+            matmul, as `|x|^2 + |y|^2 - 2 * x.y`.
+
+            :param x_mat: np.ndarray of shape (n_vectors, n_dim), the queries
+            :param y_mat: np.ndarray of shape (n_vectors, n_dim), the vectors to
+                search
+            :param k: number of values to retrieve per query
+            :param descending: retrieve largest distances instead of smallest
+            :param device: Not supported for this backend
+            :param tile_size: number of rows of y_mat to process at once. Per
+                default, chosen from the number of queries.
+            :param score_dtype: dtype used for the matmul. Per default, the dtype of
+                the inputs. The returned distances always have the dtype of x_mat.
+            :param y_norms: precomputed L2 norms of the rows of y_mat, see `l2_norm`.
+                If not provided, they are computed on the fly.
+            :return: Tuple containing the retrieved distances, and their indices
+                in y_mat. Both are of shape (n_queries, k)
+            """
+            if device is not None:
+                warnings.warn('`device` is not supported for numpy operations')
+
+            x_mat, y_mat = _expand_if_single_axis(x_mat, y_mat)
+            out_dtype = np.result_type(x_mat.dtype, np.float16)
+            x_score = x_mat if score_dtype is None else x_mat.astype(score_dtype)
+
+            x_sq = np.sum(x_mat.astype(out_dtype) ** 2, axis=1)[:, np.newaxis]
+            if y_norms is None:
+                y_sq = np.sum(y_mat.astype(out_dtype) ** 2, axis=1)
+            else:
+                y_sq = y_norms.astype(out_dtype) ** 2
+
+            def score_tile(rows: slice) -> np.ndarray:
+                tile = y_mat[rows]
+                if score_dtype is None:
+                    dists = np.dot(x_mat, tile.T).astype(out_dtype, copy=False)
+                else:
+                    dists = np.dot(x_score, tile.astype(score_dtype).T)
+                    dists = dists.astype(out_dtype)
+                dists *= -2
+                dists += x_sq
+                dists += y_sq[rows]
+                # remove numerical artifacts
+                return np.maximum(dists, 0, out=dists)
+
+            if tile_size is None:
+                tile_size = _default_tile_size(x_mat.shape[0])
+            return _tiled_top_k(score_tile, y_mat.shape[0], k, descending, tile_size)
+
+        @staticmethod
+        def euclidean_dist_topk(
+            x_mat: np.ndarray,
+            y_mat: np.ndarray,
+            k: int,
+            descending: bool = False,
+            device: Optional[str] = None,
+            tile_size: Optional[int] = None,
+            score_dtype: Optional[Any] = None,
+            y_norms: Optional[np.ndarray] = None,
+        ) -> Tuple[np.ndarray, np.ndarray]:
+            """Retrieve, for every vector in x_mat, the k vectors in y_mat with the
+            smallest euclidean distance.
+
+            The ranking is the one of `sqeuclidean_dist_topk`, only the k retrieved
+            distances are square-rooted. See `sqeuclidean_dist_topk` for the
+            parameters.
+
+            :return: Tuple containing the retrieved distances, and their indices
+                in y_mat. Both are of shape (n_queries, k)
+            """
+            dists, idx = NumpyCompBackend.Metrics.sqeuclidean_dist_topk(
+                x_mat,
+                y_mat,
+                k=k,
+                descending=descending,
+                device=device,
+                tile_size=tile_size,
+                score_dtype=score_dtype,
+                y_norms=y_norms,
+            )
+            return np.sqrt(dists), idx
 
         @classmethod
         def euclidean_dist(
@@ -231,9 +445,10 @@ class NumpyCompBackend(AbstractNumpyBasedBackend):
 
             x_mat, y_mat = _expand_if_single_axis(x_mat, y_mat)
 
-            return _expand_if_scalar(
-                np.sqrt(cls.sqeuclidean_dist(x_mat, y_mat)).squeeze()
-            )
+            dists = cls.sqeuclidean_dist(x_mat, y_mat)
+            if np.issubdtype(dists.dtype, np.inexact):
+                return np.sqrt(dists, out=dists)
+            return np.sqrt(dists)
 
         @staticmethod
         def sqeuclidean_dist(
@@ -263,12 +478,16 @@ class NumpyCompBackend(AbstractNumpyBasedBackend):
 
             x_mat, y_mat = _expand_if_single_axis(x_mat, y_mat)
 
-            dists = (
-                np.sum(y_mat**2, axis=1)
-                + np.sum(x_mat**2, axis=1)[:, np.newaxis]
-                - 2 * np.dot(x_mat, y_mat.T)
-            ).squeeze()
+            # built up in place in the matmul output, the (n_x, n_y) matrix is
+            # allocated once instead of once per term
+            dists = np.dot(x_mat, y_mat.T)
+            dists *= -2
+            # row-wise dot products, without a squared copy of the inputs
+            dists += np.einsum('ij,ij->i', x_mat, x_mat)[:, np.newaxis]
+            dists += np.einsum('ij,ij->i', y_mat, y_mat)
 
             # remove numerical artifacts
-            dists = np.where(np.logical_and(dists < 0, dists > -eps), 0, dists)
-            return _expand_if_scalar(dists)
+            artifacts = dists < 0
+            artifacts &= dists > -eps
+            dists[artifacts] = 0
+            return _expand_if_scalar(dists.squeeze())
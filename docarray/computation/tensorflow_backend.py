@@ -285,3 +285,14 @@ class TensorFlowCompBackend(AbstractNumpyBasedBackend[TensorFlowTensor]):
             )
 
             return TensorFlowCompBackend._cast_output(squared)
+
+        @staticmethod
+        def l2_norm(x_mat: 'TensorFlowTensor') -> 'TensorFlowTensor':
+            """L2 norms of the rows of a matrix.
+
+            :param x_mat: tensor of shape (n_vectors, n_dim)
+            :return: tensor of shape (n_vectors,)
+            """
+            comp_be = TensorFlowCompBackend
+            norms = tf.norm(comp_be._get_tensor(x_mat), axis=-1)
+            return comp_be._cast_output(norms)
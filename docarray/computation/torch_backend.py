@@ -1,8 +1,11 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
-from docarray.computation.abstract_comp_backend import AbstractComputationalBackend
+from docarray.computation.abstract_comp_backend import (
+    AbstractComputationalBackend,
+    _default_tile_size,
+)
 from docarray.utils._internal.misc import import_library
 
 if TYPE_CHECKING:
@@ -34,6 +37,83 @@ def _unsqueeze_if_scalar(t: torch.Tensor):
     return t
 
 
+def _quantize_rows(mat: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Symmetric int8 quantization of a matrix, with one scale per row.
+
+    :param mat: float tensor of shape (n_rows, n_dim)
+    :return: Tuple of the int8 tensor and the scales of shape (n_rows,),
+        such that `mat` is approximately `quantized * scales[:, None]`
+    """
+    scales = mat.abs().amax(dim=1).clamp(min=1e-12) / 127
+    return torch.round(mat / scales[:, None]).to(torch.int8), scales
+
+
+def _quantized_y(
+    y_mat: torch.Tensor, y_quantized: Optional[Tuple[torch.Tensor, torch.Tensor]]
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """The int8 rows and scales of y_mat, quantized once for all tiles unless they
+    are precomputed."""
+    if y_quantized is None:
+        return _quantize_rows(y_mat)
+    y_int8, y_scale = y_quantized
+    return y_int8.to(y_mat.device), y_scale.to(y_mat.device)
+
+
+def _int8_mm(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+    """Matrix product of two int8 matrices, accumulated in int32 where possible.
+
+    `torch._int_mm` only exists from PyTorch 2.1 on, and on cuda it requires more
+    than 16 rows in `a` and dimensions that are multiples of 8. Otherwise the
+    product is computed in float32, which is exact for up to ~1000 dimensions.
+    """
+    if hasattr(torch, '_int_mm') and (
+        not a.is_cuda
+        or (a.shape[0] > 16 and a.shape[1] % 8 == 0 and b.shape[1] % 8 == 0)
+    ):
+        return torch._int_mm(a, b)
+    return torch.mm(a.to(torch.float32), b.to(torch.float32))
+
+
+def _tiled_top_k(
+    score_tile: Callable[[slice], torch.Tensor],
+    n_y: int,
+    k: int,
+    descending: bool,
+    tile_size: int,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Retrieve the top k scores per query, computing the scores tile by tile.
+
+    :param score_tile: computes the (n_queries, tile) score matrix for the rows of
+        y_mat selected by the given slice
+    :param n_y: number of rows of y_mat
+    :param k: number of values to retrieve per query
+    :param descending: retrieve largest scores instead of smallest
+    :param tile_size: number of rows of y_mat to score at once
+    :return: Tuple containing the retrieved scores, and their indices in y_mat
+    """
+    k = min(k, n_y)
+
+    top_vals: Optional[torch.Tensor] = None
+    top_idx: Optional[torch.Tensor] = None
+    for start in range(0, n_y, tile_size):
+        scores = score_tile(slice(start, start + tile_size))
+        vals, idx = torch.topk(
+            scores, k=min(k, scores.shape[1]), largest=descending, dim=-1
+        )
+        idx = idx + start
+        if top_vals is not None and top_idx is not None:
+            # merge the tile candidates with the running top k
+            vals = torch.cat([top_vals, vals], dim=1)
+            idx = torch.cat([top_idx, idx], dim=1)
+            vals, pos = torch.topk(
+                vals, k=min(k, vals.shape[1]), largest=descending, dim=-1
+            )
+            idx = torch.gather(idx, 1, pos)
+        top_vals, top_idx = vals, idx
+
+    return cast(torch.Tensor, top_vals), cast(torch.Tensor, top_idx)
+
+
 class TorchCompBackend(AbstractComputationalBackend[torch.Tensor]):
     """
     Computational backend for PyTorch.
@@ -249,6 +329,222 @@ class TorchCompBackend(AbstractComputationalBackend[torch.Tensor]):
             sims = torch.mm(a_norm, b_norm.transpose(0, 1)).squeeze()
             return _unsqueeze_if_scalar(sims)
 
+        @staticmethod
+        def l2_norm(x_mat: torch.Tensor) -> torch.Tensor:
+            """L2 norms of the rows of a matrix.
+
+            :param x_mat: tensor of shape (n_vectors, n_dim)
+            :return: tensor of shape (n_vectors,)
+            """
+            return x_mat.norm(dim=-1)
+
+        @staticmethod
+        def cosine_sim_topk(
+            x_mat: torch.Tensor,
+            y_mat: torch.Tensor,
+            k: int,
+            descending: bool = True,
+            eps: float = 1e-7,
+            device: Optional[str] = None,
+            tile_size: Optional[int] = None,
+            score_dtype: Optional[torch.dtype] = None,
+            y_norms: Optional[torch.Tensor] = None,
+            y_quantized: Optional[Tuple[torch.Tensor, torch.Tensor]] = None,
+        ) -> Tuple[torch.Tensor, torch.Tensor]:
+            """Retrieve, for every vector in x_mat, the k vectors in y_mat with the
+            highest cosine similarity.
+
+            This fuses `cosine_sim` and `Retrieval.top_k`: y_mat is processed in
+            tiles of `tile_size` rows, and only a running top k per query is kept,
+            so the full (n_x, n_y) similarity matrix is never materialized.
+
+            :param x_mat: tensor of shape (n_vectors, n_dim), the queries
+            :param y_mat: tensor of shape (n_vectors, n_dim), the vectors to search
+            :param k: number of values to retrieve per query
+            :param descending: retrieve largest similarities instead of smallest
+            :param eps: a small jitter to avoid divde by zero
+            :param device: the device to use for pytorch computations.
+                Either 'cpu' or a 'cuda' device.
+                If not provided, the devices of x_mat and y_mat are used.
+            :param tile_size: number of rows of y_mat to process at once. Per
+                default, chosen from the number of queries.
+            :param score_dtype: dtype used for the similarity matmul. Per default,
+                float32 inputs on a cuda device use `torch.bfloat16`, which runs on
+                tensor cores, and other inputs use their own dtype. `torch.int8`
+                quantizes every row of x_mat and y_mat with its own scale. The
+                returned similarities always have the dtype of x_mat.
+            :param y_norms: precomputed L2 norms of the rows of y_mat, see `l2_norm`.
+                If not provided, they are computed on the fly.
+            :param y_quantized: precomputed int8 rows of y_mat and their scales,
+                see `_quantize_rows`. Only used if `score_dtype` is `torch.int8`.
+                If not provided, y_mat is quantized once per call.
+            :return: Tuple containing the retrieved similarities, and their indices
+                in y_mat. Both are of shape (n_queries, k)
+            """
+            if device is not None:
+                x_mat = x_mat.to(device)
+                y_mat = y_mat.to(device)
+
+            x_mat, y_mat = _unsqueeze_if_single_axis(x_mat, y_mat)
+
+            if y_norms is None:
+                y_norms = y_mat.norm(dim=-1)
+            else:
+                y_norms = y_norms.to(y_mat.device)
+
+            out_dtype = x_mat.dtype
+            if score_dtype is None:
+                use_bf16 = out_dtype == torch.float32 and x_mat.is_cuda
+                score_dtype = torch.bfloat16 if use_bf16 else out_dtype
+
+            # normalize the queries once, every tile is then a single matmul
+            a_norm = x_mat / torch.clamp(x_mat.norm(dim=1)[:, None], min=eps)
+            quantize = score_dtype == torch.int8
+            if quantize:
+                a_norm, a_scale = _quantize_rows(a_norm)
+                a_scale = a_scale[:, None].to(out_dtype)
+                y_int8, y_scale = _quantized_y(y_mat, y_quantized)
+            else:
+                a_norm = a_norm.to(score_dtype)
+
+            b_scale = 1 / torch.clamp(y_norms, min=eps)
+            # float16 overflows on large dot products, so there the tile has to be
+            # normalized up front. Otherwise, the (n_x, tile) similarities are
+            # scaled instead, which saves a pass over the (tile, n_dim) index rows
+            normalize_tile = score_dtype == torch.float16
+
+            def score_tile(rows: slice) -> torch.Tensor:
+                if quantize:
+                    tile_scale = (y_scale[rows] * b_scale[rows]).to(out_dtype)
+                    sims = _int8_mm(a_norm, y_int8[rows].transpose(0, 1))
+                    return sims.to(out_dtype) * a_scale * tile_scale
+                tile = y_mat[rows]
+                if normalize_tile:
+                    tile = tile * b_scale[rows][:, None]
+                sims = torch.mm(a_norm, tile.to(score_dtype).transpose(0, 1))
+                sims = sims.to(out_dtype)
+                return sims if normalize_tile else sims * b_scale[rows].to(out_dtype)
+
+            if tile_size is None:
+                tile_size = _default_tile_size(x_mat.shape[0])
+            return _tiled_top_k(score_tile, y_mat.shape[0], k, descending, tile_size)
+
+        @staticmethod
+        def sqeuclidean_dist_topk(
+            x_mat: torch.Tensor,
+            y_mat: torch.Tensor,
+            k: int,
+            descending: bool = False,
+            device: Optional[str] = None,
+            tile_size: Optional[int] = None,
+            score_dtype: Optional[torch.dtype] = None,
+            y_norms: Optional[torch.Tensor] = None,
+            y_quantized: Optional[Tuple[torch.Tensor, torch.Tensor]] = None,
+        ) -> Tuple[torch.Tensor, torch.Tensor]:
+            """Retrieve, for every vector in x_mat, the k vectors in y_mat with the
+            smallest squared euclidean distance.
+
+            This fuses `sqeuclidean_dist` and `Retrieval.top_k` like
+            `cosine_sim_topk` does: every tile of y_mat is scored with a single
+            matmul, as `|x|^2 + |y|^2 - 2 * x.y`.
+
+            :param x_mat: tensor of shape (n_vectors, n_dim), the queries
+            :param y_mat: tensor of shape (n_vectors, n_dim), the vectors to search
+            :param k: number of values to retrieve per query
+            :param descending: retrieve largest distances instead of smallest
+            :param device: the device to use for pytorch computations.
+                Either 'cpu' or a 'cuda' device.
+                If not provided, the devices of x_mat and y_mat are used.
+            :param tile_size: number of rows of y_mat to process at once. Per
+                default, chosen from the number of queries.
+            :param score_dtype: dtype used for the matmul. Per default, the dtype of
+                the inputs: the decomposition cancels out large terms, so reduced
+                precision has to be asked for explicitly. `torch.int8` quantizes
+                every row of x_mat and y_mat with its own scale. The returned
+                distances always have the dtype of x_mat.
+            :param y_norms: precomputed L2 norms of the rows of y_mat, see `l2_norm`.
+                If not provided, they are computed on the fly.
+            :param y_quantized: precomputed int8 rows of y_mat and their scales,
+                see `_quantize_rows`. Only used if `score_dtype` is `torch.int8`.
+                If not provided, y_mat is quantized once per call.
+            :return: Tuple containing the retrieved distances, and their indices
+                in y_mat. Both are of shape (n_queries, k)
+            """
+            if device is not None:
+                x_mat = x_mat.to(device)
+                y_mat = y_mat.to(device)
+
+            x_mat, y_mat = _unsqueeze_if_single_axis(x_mat, y_mat)
+
+            if y_norms is None:
+                y_norms = y_mat.norm(dim=-1)
+            else:
+                y_norms = y_norms.to(y_mat.device)
+            y_sq = y_norms**2
+
+            out_dtype = x_mat.dtype
+            if score_dtype is None:
+                score_dtype = out_dtype
+            x_sq = x_mat.norm(dim=-1)[:, None] ** 2
+            quantize = score_dtype == torch.int8
+            if quantize:
+                x_score, x_scale = _quantize_rows(x_mat)
+                x_scale = x_scale[:, None].to(out_dtype)
+                y_int8, y_scale = _quantized_y(y_mat, y_quantized)
+            else:
+                x_score = x_mat.to(score_dtype)
+
+            def score_tile(rows: slice) -> torch.Tensor:
+                if quantize:
+                    tile = y_int8[rows].transpose(0, 1)
+                    dists = _int8_mm(x_score, tile).to(out_dtype)
+                    dists = dists * x_scale * y_scale[rows].to(out_dtype)
+                else:
+                    tile = y_mat[rows].to(score_dtype)
+                    dists = torch.mm(x_score, tile.transpose(0, 1)).to(out_dtype)
+                dists = x_sq + y_sq[rows] - 2 * dists
+                # remove numerical artifacts
+                return dists.clamp_(min=0)
+
+            if tile_size is None:
+                tile_size = _default_tile_size(x_mat.shape[0])
+            return _tiled_top_k(score_tile, y_mat.shape[0], k, descending, tile_size)
+
+        @staticmethod
+        def euclidean_dist_topk(
+            x_mat: torch.Tensor,
+            y_mat: torch.Tensor,
+            k: int,
+            descending: bool = False,
+            device: Optional[str] = None,
+            tile_size: Optional[int] = None,
+            score_dtype: Optional[torch.dtype] = None,
+            y_norms: Optional[torch.Tensor] = None,
+            y_quantized: Optional[Tuple[torch.Tensor, torch.Tensor]] = None,
+        ) -> Tuple[torch.Tensor, torch.Tensor]:
+            """Retrieve, for every vector in x_mat, the k vectors in y_mat with the
+            smallest euclidean distance.
+
+            The ranking is the one of `sqeuclidean_dist_topk`, only the k retrieved
+            distances are square-rooted. See `sqeuclidean_dist_topk` for the
+            parameters.
+
+            :return: Tuple containing the retrieved distances, and their indices
+                in y_mat. Both are of shape (n_queries, k)
+            """
+            dists, idx = TorchCompBackend.Metrics.sqeuclidean_dist_topk(
+                x_mat,
+                y_mat,
+                k=k,
+                descending=descending,
+                device=device,
+                tile_size=tile_size,
+                score_dtype=score_dtype,
+                y_norms=y_norms,
+                y_quantized=y_quantized,
+            )
+            return dists.sqrt(), idx
+
         @staticmethod
         def euclidean_dist(
             x_mat: torch.Tensor, y_mat: torch.Tensor, device: Optional[str] = None
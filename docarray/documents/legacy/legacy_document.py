@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+from pydantic import Field
+
 from docarray import BaseDoc, DocList
 from docarray.typing import AnyEmbedding, AnyTensor
 
@@ -41,5 +43,5 @@ class LegacyDocument(BaseDoc):
     text: Optional[str]
     url: Optional[str]
     embedding: Optional[AnyEmbedding]
-    tags: Dict[str, Any] = dict()
+    tags: Dict[str, Any] = Field(default_factory=dict)
     scores: Optional[Dict[str, Any]]
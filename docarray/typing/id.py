@@ -31,11 +31,13 @@ class ID(str, AbstractType):
         field: 'ModelField',
         config: 'BaseConfig',
     ) -> T:
-        try:
-            id: str = str(value)
-            return cls(id)
-        except Exception:
-            raise ValueError(f'Expected a str, int or UUID, got {type(value)}')
+        if type(value) is cls:
+            return value
+        if isinstance(value, str):
+            return str.__new__(cls, value)
+        if isinstance(value, (int, UUID)):
+            return str.__new__(cls, str(value))
+        raise ValueError(f'Expected a str, int or UUID, got {type(value)}')
 
     def _to_node_protobuf(self) -> 'NodeProto':
         """Convert an ID into a NodeProto message. This function should
@@ -48,20 +48,21 @@ class _ParametrizedMeta(type):
     """
 
     def _equals_special_case(cls, other):
-        is_type = isinstance(other, type)
-        is_tensor = is_type and AbstractTensor in other.mro()
-        same_parents = is_tensor and cls.mro()[1:] == other.mro()[1:]
-
+        # compare the target shapes first: they are plain attribute lookups, and
+        # unparametrized classes (the common case, e.g. every `__torch_function__`
+        # call compares them) bail out before any MRO is built
         subclass_target_shape = getattr(other, '__docarray_target_shape__', False)
         self_target_shape = getattr(cls, '__docarray_target_shape__', False)
-        same_shape = (
-            same_parents
-            and subclass_target_shape
+        if not (
+            subclass_target_shape
             and self_target_shape
             and subclass_target_shape == self_target_shape
-        )
+        ):
+            return False
 
-        return same_shape
+        is_type = isinstance(other, type)
+        is_tensor = is_type and AbstractTensor in other.mro()
+        return is_tensor and cls.mro()[1:] == other.mro()[1:]
 
     def __subclasscheck__(cls, subclass):
         if cls._equals_special_case(subclass):
@@ -122,6 +122,12 @@ class NdArray(np.ndarray, AbstractTensor, Generic[ShapeT]):
                 return cls._docarray_from_native(arr_from_list)
             except Exception:
                 pass  # handled below
+        elif isinstance(value, AbstractTensor) or hasattr(value, '__dlpack__'):
+            # tensor of another framework: reject it right away so that the next
+            # arm of a tensor Union (e.g. `AnyEmbedding`) can pick it up, instead
+            # of probing `np.ndarray(value)`, which formats the whole tensor into
+            # its error message
+            pass  # handled below
         else:
             try:
                 arr: np.ndarray = np.ndarray(value)
@@ -1,5 +1,16 @@
-from copy import copy
-from typing import TYPE_CHECKING, Any, Dict, Generic, Type, TypeVar, Union, cast
+import warnings
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy as np
 
@@ -22,6 +33,28 @@ else:
 T = TypeVar('T', bound='TorchTensor')
 ShapeT = TypeVar('ShapeT')
 
+# numpy dtype strings, as stored in `NdArrayProto.dtype`, that torch can read
+# directly from a raw buffer with `torch.frombuffer()`
+_NP_DTYPE_STR_TO_TORCH: Dict[str, 'torch.dtype'] = {
+    np.dtype(np_dtype).str: torch_dtype
+    for np_dtype, torch_dtype in (
+        (np.bool_, torch.bool),
+        (np.uint8, torch.uint8),
+        (np.int8, torch.int8),
+        (np.int16, torch.int16),
+        (np.int32, torch.int32),
+        (np.int64, torch.int64),
+        (np.float16, torch.float16),
+        (np.float32, torch.float32),
+        (np.float64, torch.float64),
+        (np.complex64, torch.complex64),
+        (np.complex128, torch.complex128),
+    )
+}
+_TORCH_TO_NP_DTYPE_STR: Dict['torch.dtype', str] = {
+    torch_dtype: dtype_str for dtype_str, torch_dtype in _NP_DTYPE_STR_TO_TORCH.items()
+}
+
 torch_base: type = type(torch.Tensor)
 node_base: type = type(BaseNode)
 
@@ -104,6 +137,13 @@ class TorchTensor(
     """
 
     __parametrized_meta__ = metaTorchAndNode
+    # every (transitive) subclass, registered once at class creation time so that
+    # `__torch_function__` does not have to walk the class hierarchy on every op
+    _docarray_subclasses: ClassVar[FrozenSet[type]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        TorchTensor._docarray_subclasses = TorchTensor._docarray_subclasses | {cls}
 
     @classmethod
     def __get_validators__(cls):
@@ -120,6 +160,7 @@ class TorchTensor(
         config: 'BaseConfig',
     ) -> T:
         if isinstance(value, TorchTensor):
+            # re-validation of an already validated field, nothing to do
             return cast(T, value)
         elif isinstance(value, torch.Tensor):
             return cls._docarray_from_native(value)
@@ -169,11 +210,8 @@ class TorchTensor(
 
         :return: a `torch.Tensor`
         """
-        value = copy(self)  # as unintuitive as it sounds, this
-        # does not do any relevant memory copying, just shallow
-        # reference to the torch data
-        value.__class__ = torch.Tensor  # type: ignore
-        return value
+        # a new view on the same storage, created in a single C call
+        return self.as_subclass(torch.Tensor)
 
     @classmethod
     def _docarray_from_native(cls: Type[T], value: torch.Tensor) -> T:
@@ -182,6 +220,8 @@ class TorchTensor(
         :param value: the native `torch.Tensor`
         :return: a `TorchTensor`
         """
+        # the class is swapped in place rather than with `as_subclass()`, which
+        # would return a non-leaf alias and detach the user's tensor from autograd
         if cls.__unparametrizedcls__:  # This is not None if the tensor is parametrized
             value.__class__ = cls.__unparametrizedcls__  # type: ignore
         else:
@@ -198,16 +238,32 @@ class TorchTensor(
         return cls._docarray_from_native(torch.from_numpy(value))
 
     @classmethod
-    def from_protobuf(cls: Type[T], pb_msg: 'NdArrayProto') -> 'T':
+    def from_protobuf(cls: Type[T], pb_msg: 'NdArrayProto', copy: bool = True) -> 'T':
         """
         Read ndarray from a proto msg
         :param pb_msg:
+        :param copy: if False, the tensor is created without any memory copy,
+            as a read-only view into the buffer of the protobuf message.
+            Writing to such a tensor is undefined behavior.
         :return: a `TorchTensor`
         """
         source = pb_msg.dense
         if source.buffer:
-            x = np.frombuffer(bytearray(source.buffer), dtype=source.dtype)
-            return cls.from_ndarray(x.reshape(source.shape))
+            dtype = _NP_DTYPE_STR_TO_TORCH.get(source.dtype)
+            if dtype is None:
+                # dtype that torch can not read from a raw buffer, e.g. a
+                # non-native byte order, let numpy parse it
+                x = np.frombuffer(source.buffer, dtype=source.dtype)
+                x = x.astype(x.dtype.newbyteorder('='))  # writable, native copy
+                return cls.from_ndarray(x.reshape(source.shape))
+            if copy:
+                t = torch.frombuffer(bytearray(source.buffer), dtype=dtype)
+            else:
+                with warnings.catch_warnings():
+                    # torch warns that the (immutable) bytes are not writable
+                    warnings.simplefilter('ignore', category=UserWarning)
+                    t = torch.frombuffer(source.buffer, dtype=dtype)
+            return cls._docarray_from_native(t.reshape(tuple(source.shape)))
         elif len(source.shape) > 0:
             return cls.from_ndarray(np.zeros(source.shape))
         else:
@@ -222,13 +278,35 @@ class TorchTensor(
         nd_proto = NdArrayProto()
 
         value_np = self.detach().cpu().numpy()
+        # `tobytes()` is the only copy: a contiguous tensor is copied with a
+        # single memcpy, a non-contiguous one is gathered in C order on the way
         nd_proto.dense.buffer = value_np.tobytes()
-        nd_proto.dense.ClearField('shape')
-        nd_proto.dense.shape.extend(list(value_np.shape))
-        nd_proto.dense.dtype = value_np.dtype.str
+        nd_proto.dense.shape.extend(value_np.shape)
+        dtype_str = _TORCH_TO_NP_DTYPE_STR.get(self.dtype)
+        nd_proto.dense.dtype = dtype_str or value_np.dtype.str
 
         return nd_proto
 
+    def __reduce_ex__(self, protocol):
+        # the default reduction of a tensor serializes its storage with a nested
+        # `torch.save()` call. A plain cpu tensor that spans its whole storage is
+        # pickled as a numpy array instead, its buffer is written out once as is
+        t = self.as_subclass(torch.Tensor)
+        if (
+            not self.__dict__
+            and t.device.type == 'cpu'
+            and t.layout == torch.strided
+            and not t.requires_grad
+            and not t.is_conj()
+            and not t.is_neg()
+            and t.dtype in _TORCH_TO_NP_DTYPE_STR
+            and t.storage_offset() == 0
+            and t.is_contiguous()
+            and t.untyped_storage().nbytes() == t.numel() * t.element_size()
+        ):
+            return _rebuild_from_ndarray, (type(self), t.numpy())
+        return super().__reduce_ex__(protocol)
+
     @staticmethod
     def get_comp_backend() -> 'TorchCompBackend':
         """Return the computational backend of the tensor"""
@@ -241,8 +319,14 @@ class TorchTensor(
         # this tells torch to treat all of our custom tensors just like
         # torch.Tensor's. Otherwise, torch will complain that it doesn't
         # know how to handle our custom tensor type.
-        docarray_torch_tensors = TorchTensor.__subclasses__()
-        types_ = tuple(
-            torch.Tensor if t in docarray_torch_tensors else t for t in types
-        )
-        return super().__torch_function__(func, types_, args, kwargs)
+        docarray_torch_tensors = TorchTensor._docarray_subclasses
+        if any(t in docarray_torch_tensors for t in types):
+            types = tuple(
+                torch.Tensor if t in docarray_torch_tensors else t for t in types
+            )
+        return super().__torch_function__(func, types, args, kwargs)
+
+
+def _rebuild_from_ndarray(cls: Type[T], value: np.ndarray) -> T:
+    """Unpickle a `TorchTensor` that was pickled by `TorchTensor.__reduce_ex__`"""
+    return cls._docarray_from_native(torch.from_numpy(value))
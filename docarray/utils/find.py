@@ -1,7 +1,26 @@
 __all__ = ['find', 'find_batched']
 
-from typing import Any, Dict, List, NamedTuple, Optional, Type, Union, cast
-
+import operator
+import os
+import weakref
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import numpy as np
 from typing_inspect import is_union_type
 
 from multiprocessing.pool import Pool, ThreadPool
@@ -10,11 +29,28 @@ from docarray.array.any_array import AnyDocArray
 from docarray.array.doc_list.doc_list import DocList
 from docarray.array.doc_vec.doc_vec import DocVec
 from docarray.base_doc import BaseDoc
+from docarray.computation import AbstractComputationalBackend
 from docarray.helper import _get_field_type_by_access_path
 from docarray.typing import AnyTensor
 from docarray.typing.tensor.abstract_tensor import AbstractTensor
-from docarray.utils.map import _map_docs_batched_multiarg
-from docarray.documents import TextDoc
+from docarray.utils._internal.misc import is_torch_available
+from docarray.utils.map import _map_docs_batched_multiarg, _map_tensor_batched
+
+torch_available = is_torch_available()
+if torch_available:
+    import torch
+
+if TYPE_CHECKING:
+    # only available from Python 3.8 on, imported where it is used
+    from multiprocessing.shared_memory import SharedMemory
+
+
+# the supported metrics, and whether their best matches have the largest scores
+_DESCENDING = {
+    'cosine_sim': True,
+    'euclidean_dist': False,
+    'sqeuclidean_dist': False,
+}
 
 
 class FindResult(NamedTuple):
@@ -45,6 +81,8 @@ def find(
     limit: int = 10,
     device: Optional[str] = None,
     descending: Optional[bool] = None,
+    score_dtype: Optional[Any] = None,
+    cache_index: bool = False,
 ) -> FindResult:
     """
     Find the closest Documents in the index to the query.
@@ -102,37 +140,77 @@ def find(
         can be either `cpu` or a `cuda` device.
     :param descending: sort the results in descending order.
         Per default, this is chosen based on the `metric` argument.
+    :param score_dtype: the dtype of the matmul that scores the queries against
+        the index, e.g. `torch.float16`. For `cosine_sim`, float32 PyTorch
+        embeddings on a `cuda` device are scored in `torch.bfloat16` per default,
+        which runs on tensor cores. The euclidean metrics are computed as
+        `|q|^2 + |x|^2 - 2 * q.x`, which is sensitive to rounding, so they only use
+        reduced precision when asked to; the norms are always kept in the dtype
+        of the embeddings. For PyTorch embeddings, `torch.int8` quantizes every
+        query and index embedding with its own scale, and accumulates the dot
+        products in int32. Quantizing the index costs more than a float32
+        search, so only use `torch.int8` together with `cache_index`. The
+        returned scores always have the dtype of the embeddings.
+    :param cache_index: keep the stacked embeddings of the index, their norms,
+        and their int8 quantization if `score_dtype` is `torch.int8`,
+        around and reuse them in later searches over the same index.
+        Adding, removing or replacing Documents or their embeddings is detected.
+        In-place changes to the embeddings are only detected for PyTorch
+        embeddings of a `DocVec`, so only set this if the embeddings are not
+        otherwise modified in-place between searches.
     :return: A named tuple of the form (DocList, AnyTensor),
         where the first element contains the closes matches for the query,
         and the second element contains the corresponding scores.
     """
-    query = _extract_embedding_single(query, search_field)
-    docs, scores = find_batched(
+    _, embedding_type, func_args = _prepare_search(
         index=index,
-        query=query,
         search_field=search_field,
         metric=metric,
         limit=limit,
         device=device,
         descending=descending,
+        score_dtype=score_dtype,
+        cache_index=cache_index,
+    )
+    query_embs = _extract_embeddings(query, search_field, embedding_type)
+    # a single query does not need the batching machinery of `find_batched`
+    top_indices, top_scores = get_result(query_embs, **func_args)
+    return FindResult(
+        documents=_gather_docs(index, top_indices)[0], scores=top_scores[0]
     )
-    return FindResult(documents=docs[0], scores=scores[0])
 
 
 def get_result(
     query_embeds,
     index_embeddings,
     device,
-    comp_backend,
-    search_field,
-    embedding_type,
+    top_k_fn,
     metric_fn,
+    metric_topk_fn,
     limit,
     descending,
+    score_dtype,
+    index_norms,
+    index_quantized,
 ):
     q_embed = query_embeds
+    if metric_topk_fn is not None:
+        # fused metric + top k, the full distance matrix is never materialized
+        kwargs = {} if index_norms is None else {'y_norms': index_norms}
+        if index_quantized is not None:
+            kwargs['y_quantized'] = index_quantized
+        top_scores, top_indices = metric_topk_fn(
+            q_embed,
+            index_embeddings,
+            k=limit,
+            descending=descending,
+            device=device,
+            score_dtype=score_dtype,
+            **kwargs,
+        )
+        return top_indices, top_scores
     dists = metric_fn(q_embed, index_embeddings, device=device)
-    top_scores, top_indices = comp_backend.Retrieval.top_k(
+    top_scores, top_indices = top_k_fn(
         dists, k=limit, device=device, descending=descending
     )
     return top_indices, top_scores
@@ -147,6 +225,8 @@ def find_batched(
     limit: int = 10,
     device: Optional[str] = None,
     descending: Optional[bool] = None,
+    score_dtype: Optional[Any] = None,
+    cache_index: bool = False,
     shuffle: bool = False,
     backend: str = 'thread',
     num_worker: Optional[int] = None,
@@ -162,6 +242,11 @@ def find_batched(
         search using approximate nearest neighbours search or hybrid search or
         multi vector search please take a look at the [`BaseDoc`][docarray.base_doc.doc.BaseDoc]
 
+    !!! tip
+        A `DocList` index is stacked into a single tensor on every call. To search
+        the same index repeatedly, convert it once with `index.to_doc_vec()`: a
+        `DocVec` keeps every tensor field in one contiguous column, which is
+        searched as is.
 
     ---
 
@@ -206,7 +291,11 @@ def find_batched(
     :param search_field: the tensor-like field in the index to use
         for the similarity computation
     :param batch_size: Size of each generated batch (except the last one, which might
-        be smaller).
+        be smaller). If not given, the queries are split into one chunk per
+        worker thread once there are more than two queries per worker. This
+        only applies to NumPy embeddings searched on threads, i.e. if `backend`
+        is `thread` or `pool` is a `ThreadPool`. Otherwise all queries are scored
+        against the index in a single matmul.
     :param metric: the distance metric to use for the similarity computation.
         Can be one of the following strings:
         'cosine_sim' for cosine similarity, 'euclidean_dist' for euclidean distance,
@@ -216,6 +305,24 @@ def find_batched(
         can be either `cpu` or a `cuda` device.
     :param descending: sort the results in descending order.
         Per default, this is chosen based on the `metric` argument.
+    :param score_dtype: the dtype of the matmul that scores the queries against
+        the index, e.g. `torch.float16`. For `cosine_sim`, float32 PyTorch
+        embeddings on a `cuda` device are scored in `torch.bfloat16` per default,
+        which runs on tensor cores. The euclidean metrics are computed as
+        `|q|^2 + |x|^2 - 2 * q.x`, which is sensitive to rounding, so they only use
+        reduced precision when asked to; the norms are always kept in the dtype
+        of the embeddings. For PyTorch embeddings, `torch.int8` quantizes every
+        query and index embedding with its own scale, and accumulates the dot
+        products in int32. Quantizing the index costs more than a float32
+        search, so only use `torch.int8` together with `cache_index`. The
+        returned scores always have the dtype of the embeddings.
+    :param cache_index: keep the stacked embeddings of the index, their norms,
+        and their int8 quantization if `score_dtype` is `torch.int8`,
+        around and reuse them in later searches over the same index.
+        Adding, removing or replacing Documents or their embeddings is detected.
+        In-place changes to the embeddings are only detected for PyTorch
+        embeddings of a `DocVec`, so only set this if the embeddings are not
+        otherwise modified in-place between searches.
     :param shuffle: If set, shuffle the Documents before dividing into minibatches.
     :param backend: `thread` for multithreading and `process` for multiprocessing.
         Defaults to `thread`.
@@ -229,98 +336,344 @@ def find_batched(
         and the second element contains the corresponding scores.
     """
 
+    comp_backend, embedding_type, func_args = _prepare_search(
+        index=index,
+        search_field=search_field,
+        metric=metric,
+        limit=limit,
+        device=device,
+        descending=descending,
+        score_dtype=score_dtype,
+        cache_index=cache_index,
+    )
+
+    if batch_size is not None:
+        if batch_size <= 0:
+            raise ValueError(
+                f'`batch_size` must be larger than 0, receiving {batch_size}'
+            )
+        else:
+            batch_size = int(batch_size)
+
+    if batch_size is None:
+        query_embs = _extract_embeddings(query, search_field, embedding_type)
+        chunk_size = None
+        if pool is None and backend == 'thread':
+            chunk_size = _auto_chunk_size(
+                comp_backend, query_embs, func_args['index_embeddings'], num_worker
+            )
+        elif isinstance(pool, ThreadPool):
+            chunk_size = _auto_chunk_size(
+                comp_backend,
+                query_embs,
+                func_args['index_embeddings'],
+                pool._processes,  # type: ignore[attr-defined]
+            )
+        if chunk_size is None:
+            top_indices, top_scores = get_result(query_embs, **func_args)
+            return FindResultBatched(
+                documents=_gather_docs(index, top_indices), scores=list(top_scores)
+            )
+        return _find_chunked(index, query_embs, chunk_size, func_args, num_worker, pool)
+
+    func: Callable = get_result
+    shm: Optional['SharedMemory'] = None
+    if (backend == 'process') if pool is None else not isinstance(pool, ThreadPool):
+        # pickling the index embeddings for every batch would copy them through
+        # the pipes once per batch, the workers map them from shared memory instead
+        shared = _share_embeddings(func_args['index_embeddings'])
+        if shared is not None:
+            shm, func_args['index_embeddings'] = shared
+            # the workers quantize their view of the index themselves, once per
+            # batch, rather than receiving a pickled copy of the quantized index
+            func_args['index_quantized'] = None
+            func = _get_result_shared
+
+    flat_indices: List[int] = []
+    docs_scores: List[AnyTensor] = []
+    n_matches = limit
+    try:
+        it: Iterable[Tuple[AnyTensor, AnyTensor]]
+        if isinstance(query, (DocList, DocVec, BaseDoc)):
+            it = _map_docs_batched_multiarg(
+                docs=query,
+                func=func,
+                batch_size=batch_size,
+                backend=backend,
+                num_worker=num_worker,
+                shuffle=shuffle,
+                pool=pool,
+                show_progress=show_progress,
+                func_args=func_args,
+                search_field=search_field,
+                embedding_type=embedding_type,
+            )
+        else:
+            # a tensor query is sliced as it is, without wrapping it into Documents
+            it = _map_tensor_batched(
+                tensor=_extract_embeddings(query, search_field, embedding_type),
+                func=func,
+                batch_size=batch_size,
+                backend=backend,
+                num_worker=num_worker,
+                shuffle=shuffle,
+                pool=pool,
+                show_progress=show_progress,
+                func_args=func_args,
+            )
+        for indices_per_query, scores_per_query in it:
+            # fewer than `limit` matches per query if the index is smaller
+            n_matches = indices_per_query.shape[1]
+            flat_indices.extend(indices_per_query.reshape(-1).tolist())
+            docs_scores.extend(scores_per_query)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    # the matches of all batches are gathered from the index in one pass
+    retrieved_docs = _gather_flat_docs(index, flat_indices, len(docs_scores), n_matches)
+    return FindResultBatched(documents=retrieved_docs, scores=docs_scores)
+
+
+class _SharedEmbeddings(NamedTuple):
+    """Index embeddings placed in shared memory. Pickles to a few bytes."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+    is_torch: bool
+
+
+def _share_embeddings(
+    embeddings: AnyTensor,
+) -> Optional[Tuple['SharedMemory', _SharedEmbeddings]]:
+    """Copy the embeddings into a new block of shared memory.
+
+    :param embeddings: NumPy or CPU PyTorch embeddings
+    :return: the shared memory, which the caller has to unlink once done, and the
+        reference to pass to `_get_result_shared`. None if the embeddings can not
+        be shared, e.g. because they live on a GPU, or because shared memory is
+        not available (Python < 3.8).
+    """
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:
+        return None
+
+    if isinstance(embeddings, np.ndarray):
+        array, is_torch = embeddings, False
+    elif (
+        torch_available
+        and isinstance(embeddings, torch.Tensor)
+        and embeddings.device.type == 'cpu'
+    ):
+        try:
+            array, is_torch = embeddings.detach().numpy(), True
+        except TypeError:  # dtypes without a NumPy counterpart, e.g. bfloat16
+            return None
+    else:
+        return None
+
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, _SharedEmbeddings(shm.name, array.shape, array.dtype.str, is_torch)
+
+
+def _get_result_shared(query_embeds, index_embeddings: _SharedEmbeddings, *args):
+    """`get_result` for worker processes, reading the index embeddings from
+    shared memory instead of receiving a copy of them."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(name=index_embeddings.name)
+    array: Optional[np.ndarray] = None
+    tensor: Optional['torch.Tensor'] = None
+    try:
+        array = np.ndarray(
+            index_embeddings.shape, dtype=index_embeddings.dtype, buffer=shm.buf
+        )
+        if index_embeddings.is_torch:
+            tensor = torch.from_numpy(array)
+        return get_result(query_embeds, array if tensor is None else tensor, *args)
+    finally:
+        # the buffer can only be closed once nothing refers to it anymore
+        array = tensor = None
+        shm.close()
+
+
+def _auto_chunk_size(
+    comp_backend: AbstractComputationalBackend,
+    query_embs: AnyTensor,
+    index_embeddings: AnyTensor,
+    num_worker: Optional[int],
+) -> Optional[int]:
+    """Pick a chunk size to spread the queries over worker threads.
+
+    Chunks hold at least 10 queries, and chunking only starts once there are
+    more than two queries per worker. Only NumPy embeddings are chunked:
+    PyTorch already spreads a single matmul over its own intra-op threads on
+    the CPU, and keeps a GPU busy with it.
+
+    :param num_worker: the number of threads the chunks are searched on
+    :return: the number of queries per chunk, or None to search in one go
+    """
+    if not isinstance(index_embeddings, np.ndarray):
+        return None
+    n_workers = num_worker or os.cpu_count() or 1
+    n_queries = comp_backend.shape(query_embs)[0]
+    if n_workers < 2 or n_queries <= 2 * n_workers:
+        return None
+    chunk_size = max(10, n_queries // n_workers)
+    return chunk_size if chunk_size < n_queries else None
+
+
+def _find_chunked(
+    index: AnyDocArray,
+    query_embs: AnyTensor,
+    chunk_size: int,
+    func_args: Dict[str, Any],
+    num_worker: Optional[int],
+    pool: Optional[Union[Pool, ThreadPool]],
+) -> FindResultBatched:
+    """Search chunks of the query embeddings in parallel threads.
+
+    The embeddings are sliced as they are, without wrapping them into Documents.
+    """
+    n_queries = query_embs.shape[0]
+    args_list = [
+        [query_embs[i : i + chunk_size], *func_args.values()]
+        for i in range(0, n_queries, chunk_size)
+    ]
+    context_pool: Union[nullcontext, ThreadPool]
+    if pool:
+        p = pool
+        context_pool = nullcontext()
+    else:
+        p = ThreadPool(processes=num_worker)
+        context_pool = p
+    with context_pool:
+        results = p.starmap(get_result, args_list)
+
+    flat_indices: List[int] = []
+    docs_scores: List[AnyTensor] = []
+    n_matches = func_args['limit']
+    for indices_per_query, scores_per_query in results:
+        # fewer than `limit` matches per query if the index is smaller
+        n_matches = indices_per_query.shape[1]
+        flat_indices.extend(indices_per_query.reshape(-1).tolist())
+        docs_scores.extend(scores_per_query)
+    retrieved_docs = _gather_flat_docs(index, flat_indices, len(docs_scores), n_matches)
+    return FindResultBatched(documents=retrieved_docs, scores=docs_scores)
+
+
+def _prepare_search(
+    index: AnyDocArray,
+    search_field: str,
+    metric: str,
+    limit: int,
+    device: Optional[str],
+    descending: Optional[bool],
+    score_dtype: Optional[Any],
+    cache_index: bool,
+) -> Tuple[AbstractComputationalBackend, Type[AnyTensor], Dict[str, Any]]:
+    """Resolve everything a search needs apart from the queries.
+
+    :return: the computational backend and the type of the index embeddings,
+        and the arguments to pass to `get_result` after the query embeddings
+    """
+    if metric not in _DESCENDING:
+        raise ValueError(
+            f'Unknown metric `{metric}`, expected one of {list(_DESCENDING)}'
+        )
     if descending is None:
-        descending = metric.endswith('_sim')  # similarity metrics are descending
+        descending = _DESCENDING[metric]
 
     embedding_type = _da_attr_type(index, search_field)
-    comp_backend = embedding_type.get_comp_backend()
+    comp_backend, metric_fn, top_k_fn, metric_topk_fn = _resolve_backend(
+        embedding_type, metric
+    )
     # extract embeddings from index
-    index_embeddings = _extract_embeddings(index, search_field, embedding_type)
-    metric_fn = getattr(comp_backend.Metrics, metric)
+    if cache_index and isinstance(index, DocList):
+        index_embeddings = _cached_doc_list_embeddings(
+            index, search_field, embedding_type
+        )
+    else:
+        index_embeddings = _extract_embeddings(index, search_field, embedding_type)
+
+    index_norms = index_quantized = None
+    if metric_topk_fn is not None:
+        # computed once here instead of once per query batch
+        index_norms = _index_norms(index_embeddings, comp_backend, cache_index)
+        if (
+            torch_available
+            and score_dtype == torch.int8
+            and isinstance(index_embeddings, torch.Tensor)
+        ):
+            index_quantized = _index_quantized(index_embeddings, cache_index)
 
+    # only what `get_result` computes with, these are sent to every worker
     func_args = {
         'index_embeddings': index_embeddings,
         'device': device,
-        'comp_backend': comp_backend,
-        'search_field': search_field,
-        'embedding_type': embedding_type,
+        'top_k_fn': top_k_fn,
         'metric_fn': metric_fn,
+        'metric_topk_fn': metric_topk_fn,
         'limit': limit,
         'descending': descending,
+        'score_dtype': score_dtype,
+        'index_norms': index_norms,
+        'index_quantized': index_quantized,
     }
+    return comp_backend, embedding_type, func_args
 
-    if batch_size is not None:
-        if batch_size <= 0:
-            raise ValueError(
-                f'`batch_size` must be larger than 0, receiving {batch_size}'
-            )
-        else:
-            batch_size = int(batch_size)
-    else:
-        query_embs = _extract_embeddings(query, search_field, embedding_type)
-        top_indices, top_scores = get_result(query_embs, **func_args)
-        batched_docs: List[DocList] = []
-        scores = []
-        for _, (indices_per_query, scores_per_query) in enumerate(
-            zip(top_indices, top_scores)
-        ):
-            docs_per_query: DocList = DocList([])
-            for idx in indices_per_query:  # workaround until #930 is fixed
-                docs_per_query.append(index[idx])
-            batched_docs.append(DocList(docs_per_query))
-            scores.append(scores_per_query)
-        return FindResultBatched(documents=batched_docs, scores=scores)
-
-    if not (isinstance(query, DocList) or isinstance(query, (DocVec, BaseDoc))):
-        query = cast(AnyTensor, query)
-        d = DocList[TextDoc](TextDoc() for _ in range(comp_backend.shape(query)[0]))
-        d.embedding = query  # type: ignore
-        query = d
-
-    it = _map_docs_batched_multiarg(
-        docs=query,
-        func=get_result,
-        batch_size=batch_size,
-        backend=backend,
-        num_worker=num_worker,
-        shuffle=shuffle,
-        pool=pool,
-        show_progress=show_progress,
-        func_args=func_args,
+
+def _gather_docs(index: AnyDocArray, top_indices: AnyTensor) -> List[DocList]:
+    """Collect the matched Documents of every query from the index.
+
+    :param index: the index the matches were retrieved from
+    :param top_indices: indices of the matches, of shape (n_queries, limit)
+    :return: one `DocList` per query
+    """
+    # a single conversion to python ints, instead of boxing every
+    # element of the tensor into a 0-dim tensor
+    flat_indices: List[int] = top_indices.reshape(-1).tolist()
+    return _gather_flat_docs(
+        index, flat_indices, top_indices.shape[0], top_indices.shape[1]
     )
-    retrieved_docs: List[DocList] = []
-    docs_scores: List[AnyTensor] = []
-    for indices_per_query, scores_per_query in it:
-        for idx, scores in zip(indices_per_query, scores_per_query):
-            per_query_docs: DocList = DocList([])
-            for id in idx:  # workaround until #930 is fixed
-                per_query_docs.append(index[id])
-            retrieved_docs.append(DocList(per_query_docs))
-            docs_scores.append(scores)  # type: ignore
-    return FindResultBatched(documents=retrieved_docs, scores=docs_scores)
 
 
-def _extract_embedding_single(
-    data: Union[DocList, BaseDoc, AnyTensor],
-    search_field: str,
-) -> AnyTensor:
-    """Extract the embeddings from a single query,
-    and return it in a batched representation.
+def _gather_flat_docs(
+    index: AnyDocArray, flat_indices: List[int], n_queries: int, limit: int
+) -> List[DocList]:
+    """Collect the matched Documents of every query from the index.
 
-    :param data: the data
-    :param search_field: the embedding field
-    :param embedding_type: type of the embedding: torch.Tensor, numpy.ndarray etc.
-    :return: the embeddings
+    The matches of all queries are looked up in a single loop over the
+    flattened indices, and then split into one result per query by slicing.
+
+    :param index: the index the matches were retrieved from
+    :param flat_indices: indices of the matches of all queries, `limit` per query
+    :param n_queries: number of queries
+    :param limit: number of matches per query
+    :return: one `DocList` per query
     """
-    if isinstance(data, BaseDoc):
-        emb = next(AnyDocArray._traverse(data, search_field))
-    else:  # treat data as tensor
-        emb = data
-    if len(emb.shape) == 1:
-        # all currently supported frameworks provide `.reshape()`. Onc this is not true
-        # anymore, we need to add a `.reshape()` method to the computational backend
-        emb = emb.reshape(1, -1)
-    return emb
+    doc_list_cls: Type[DocList] = (
+        index.__class__
+        if isinstance(index, DocList)
+        else DocList.__class_getitem__(index.doc_type)
+    )
+    if limit == 0:
+        return [doc_list_cls.construct([]) for _ in range(n_queries)]
+    if isinstance(index, DocList):
+        data = index._data
+        matches = [data[i] for i in flat_indices]
+    else:
+        # one view per match on the rows of the columns of the DocVec, the
+        # columns are not gathered: the results are row views into the index
+        matches = [index[i] for i in flat_indices]
+    # the Documents come from the index, they do not need to be validated again
+    return [
+        doc_list_cls.construct(matches[i : i + limit])
+        for i in range(0, len(matches), limit)
+    ]
 
 
 def _extract_embeddings(
@@ -337,16 +690,212 @@ def _extract_embeddings(
     """
     emb: AnyTensor
     if isinstance(data, DocList):
-        emb_list = list(AnyDocArray._traverse(data, search_field))
-        emb = embedding_type._docarray_stack(emb_list)
-    elif isinstance(data, (DocVec, BaseDoc)):
-        emb = next(AnyDocArray._traverse(data, search_field))
+        # one stack call over all Documents, the result is already 2D
+        return embedding_type._docarray_stack(_doc_list_field(data, search_field))
+    elif isinstance(data, DocVec):
+        # the column is stored as a single stacked tensor, return it as is
+        if '__' not in search_field:
+            return cast(AnyTensor, data._get_data_column(search_field))
+        return next(AnyDocArray._traverse(data, search_field))
+    elif isinstance(data, BaseDoc):
+        getter = _field_getter(data.__class__, search_field)
+        if getter is not None:
+            emb = getter(data)
+        else:
+            emb = next(AnyDocArray._traverse(data, search_field))
     else:  # treat data as tensor
         emb = cast(AnyTensor, data)
+    return _ensure_2d(emb, embedding_type.get_comp_backend())
+
 
-    if len(emb.shape) == 1:
-        emb = emb.get_comp_backend().reshape(array=emb, shape=(1, -1))
-    return emb
+def _ensure_2d(emb: AnyTensor, comp_backend: AbstractComputationalBackend) -> AnyTensor:
+    """Reshape a single embedding of shape (n_dim,) into a batch of shape
+    (1, n_dim). Embeddings that already are batched are returned as they are."""
+    if len(emb.shape) != 1:
+        return emb
+    return comp_backend.reshape(emb, (1, -1))
+
+
+@lru_cache(maxsize=None)
+def _field_getter(
+    doc_type: Type[BaseDoc], access_path: str
+) -> Optional[Callable[[Any], Any]]:
+    """Compile the "__"-separated access path into an `operator.attrgetter`.
+
+    This is only possible if every field along the path, apart from the last one,
+    holds a single Document. Paths that pass through a list or DocList of
+    Documents yield several values per Document and need the generic traversal.
+
+    :param doc_type: the Document type the path starts from
+    :param access_path: the "__"-separated access path
+    :return: the attribute getter, or None if the path cannot be compiled
+    """
+    *parents, _ = access_path.split('__')
+    field_type: Any = doc_type
+    for attr in parents:
+        if attr not in field_type.__fields__:
+            return None
+        field_type = field_type._get_field_type(attr)
+        if not (isinstance(field_type, type) and issubclass(field_type, BaseDoc)):
+            return None
+    return operator.attrgetter(access_path.replace('__', '.'))
+
+
+def _doc_list_field(data: DocList, search_field: str) -> List[Any]:
+    """Collect the values of a field of all Documents of a DocList."""
+    getter = _field_getter(data.doc_type, search_field)
+    if getter is not None:
+        # attribute access in C, cheaper than the generic traversal
+        return list(map(getter, data._data))
+    return list(AnyDocArray._traverse(data, search_field))
+
+
+# stacked embeddings of DocList indices kept by `cache_index`, keyed by `id()` of the
+# DocList and the search field. Next to a weak reference to the DocList, the entries
+# hold the embeddings of the Documents that were stacked, to detect changes.
+_doc_list_embeddings_cache: Dict[
+    Tuple[int, str], Tuple['weakref.ref', List[Any], AnyTensor]
+] = {}
+
+
+def _cached_doc_list_embeddings(
+    index: DocList, search_field: str, embedding_type: Type
+) -> AnyTensor:
+    """Get the stacked embeddings of a DocList, reusing the result of an earlier
+    call if the DocList still holds the very same embeddings.
+
+    Comparing the embeddings by identity is a single pass over pointers, which is
+    much cheaper than stacking them, and catches Documents or embeddings that were
+    added, removed or replaced since.
+
+    :param index: the DocList
+    :param search_field: the embedding field
+    :param embedding_type: type of the embedding: torch.Tensor, numpy.ndarray etc.
+    :return: the stacked embeddings
+    """
+    emb_list = _doc_list_field(index, search_field)
+    key = (id(index), search_field)
+    cached = _doc_list_embeddings_cache.get(key)
+    if cached is not None:
+        ref, cached_list, embeddings = cached
+        if (
+            ref() is index
+            and len(cached_list) == len(emb_list)
+            and all(map(operator.is_, cached_list, emb_list))
+        ):
+            return embeddings
+
+    embeddings = embedding_type._docarray_stack(emb_list)
+    ref = weakref.ref(index, lambda _: _doc_list_embeddings_cache.pop(key, None))
+    _doc_list_embeddings_cache[key] = (ref, emb_list, embeddings)
+    return embeddings
+
+
+# values derived from index embeddings and kept by `cache_index`, keyed by the name
+# of the value and `id()` of the embeddings. Tensors are not hashable in general,
+# so the entries hold a weak reference to the embeddings instead, which also
+# evicts them once the embeddings are gone.
+_index_derived_cache: Dict[Tuple[str, int], Tuple['weakref.ref', Any, Any]] = {}
+
+
+def _cached_index_derived(
+    name: str,
+    index_embeddings: Any,
+    compute: Callable[[Any], Any],
+    cache_index: bool,
+) -> Any:
+    """Compute a value from the index embeddings, or reuse the value computed by
+    an earlier call with the same, unchanged embeddings.
+
+    :param name: name of the value, e.g. 'norms'
+    :param index_embeddings: the embeddings of the index, of shape (n_docs, n_dim)
+    :param compute: computes the value from the embeddings
+    :param cache_index: reuse the value from an earlier call with the same
+        embeddings, and keep it around for later calls
+    :return: the value
+    """
+    if not cache_index:
+        return compute(index_embeddings)
+
+    key = (name, id(index_embeddings))
+    # torch bumps `_version` on every in-place change of a tensor
+    version = getattr(index_embeddings, '_version', None)
+    cached = _index_derived_cache.get(key)
+    if cached is not None:
+        ref, cached_version, value = cached
+        if ref() is index_embeddings and cached_version == version:
+            return value
+
+    value = compute(index_embeddings)
+    ref = weakref.ref(index_embeddings, lambda _: _index_derived_cache.pop(key, None))
+    _index_derived_cache[key] = (ref, version, value)
+    return value
+
+
+def _index_norms(
+    index_embeddings: AnyTensor,
+    comp_backend: AbstractComputationalBackend,
+    cache_index: bool,
+) -> AnyTensor:
+    """Get the L2 norms of the rows of the index embeddings.
+
+    :param index_embeddings: the embeddings of the index, of shape (n_docs, n_dim)
+    :param comp_backend: the computational backend of the embeddings
+    :param cache_index: reuse the norms from an earlier call with the same
+        embeddings, and keep them around for later calls
+    :return: the norms, of shape (n_docs,)
+    """
+    l2_norm: Callable = comp_backend.Metrics.l2_norm
+    return _cached_index_derived('norms', index_embeddings, l2_norm, cache_index)
+
+
+def _index_quantized(
+    index_embeddings: 'torch.Tensor', cache_index: bool
+) -> Tuple['torch.Tensor', 'torch.Tensor']:
+    """Get the index embeddings quantized to int8, for `score_dtype=torch.int8`.
+
+    Quantizing reads the whole index several times, so with `cache_index` this
+    is done once, and later searches only read the int8 rows.
+
+    :param index_embeddings: PyTorch embeddings of the index, of shape (n_docs, n_dim)
+    :param cache_index: reuse the quantized embeddings from an earlier call with
+        the same embeddings, and keep them around for later calls
+    :return: the int8 embeddings, and the scale of every row, of shape (n_docs,)
+    """
+    from docarray.computation.torch_backend import _quantize_rows
+
+    return _cached_index_derived('int8', index_embeddings, _quantize_rows, cache_index)
+
+
+@lru_cache(maxsize=None)
+def _resolve_backend(
+    embedding_type: Type[AnyTensor], metric: str
+) -> Tuple[AbstractComputationalBackend, Callable, Callable, Optional[Callable]]:
+    """Resolve the computational backend of a tensor type, together with the
+    metric and top k functions to use for the search.
+
+    The result only depends on the tensor type and the metric name, so it is
+    computed once and reused by every subsequent search.
+
+    :param embedding_type: type of the embedding: TorchTensor, NdArray etc.
+    :param metric: name of the metric, e.g. 'cosine_sim'
+    :return: a tuple of the form (comp_backend, metric_fn, top_k_fn, metric_topk_fn)
+        where `metric_topk_fn` is the fused metric + top k implementation of the
+        backend, or None if the backend does not provide one for this metric
+    """
+    comp_backend = embedding_type.get_comp_backend()
+    metric_fn = getattr(comp_backend.Metrics, metric)
+    metric_topk_fn = getattr(comp_backend.Metrics, f'{metric}_topk', None)
+    return comp_backend, metric_fn, comp_backend.Retrieval.top_k, metric_topk_fn
+
+
+@lru_cache(maxsize=None)
+def _field_type_by_access_path(
+    doc_type: Type[BaseDoc], access_path: str
+) -> Optional[Type]:
+    """Cached version of `_get_field_type_by_access_path`, the schema of a
+    Document type does not change after its creation."""
+    return _get_field_type_by_access_path(doc_type, access_path)
 
 
 def _da_attr_type(docs: AnyDocArray, access_path: str) -> Type[AnyTensor]:
@@ -357,9 +906,7 @@ def _da_attr_type(docs: AnyDocArray, access_path: str) -> Type[AnyTensor]:
     :param access_path: the "__"-separated access path
     :return: the type of the attribute
     """
-    field_type: Optional[Type] = _get_field_type_by_access_path(
-        docs.doc_type, access_path
-    )
+    field_type: Optional[Type] = _field_type_by_access_path(docs.doc_type, access_path)
     if field_type is None:
         raise ValueError(f"Access path is not valid: {access_path}")
 
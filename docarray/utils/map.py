@@ -1,8 +1,18 @@
 __all__ = ['map_docs', 'map_docs_batched']
+import random
 from contextlib import nullcontext
 from math import ceil
 from multiprocessing.pool import Pool, ThreadPool
-from typing import Callable, Generator, Optional, TypeVar, Union, Any, Mapping
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from rich.progress import track
 
@@ -209,50 +219,57 @@ def _map_docs_batched_multiarg(
     func: Callable[..., Union[T, Any]],
     batch_size: int,
     func_args: Mapping[str, Any],
+    search_field: str,
+    embedding_type: Type,
     backend: str = "thread",
     num_worker: Optional[int] = None,
     shuffle: bool = False,
     pool: Optional[Union[Pool, ThreadPool]] = None,
     show_progress: bool = False,
-) -> Generator[Union[T, T_doc], None, None]:
+) -> Generator[Any, None, None]:
     """
-    Return an iterator that applies `func` to every **minibatch** of iterable in parallel,
-    yielding the results.
-    Each element in the returned iterator is an :class:`AnyDocArray`.
+    Return an iterator that applies `func` to the embeddings of every **minibatch**
+    of Documents in parallel, yielding the results.
+    `func` is called with the embeddings of a minibatch as first argument, followed
+    by the values of `func_args` in their order.
 
     ---
 
     ```python
+    import numpy as np
+
     from docarray import BaseDoc, DocList
+    from docarray.typing import NdArray
     from docarray.utils.map import _map_docs_batched_multiarg
 
 
     class MyDoc(BaseDoc):
-        name: str
+        embedding: NdArray
 
 
-    def case_name(docs: DocList[MyDoc],upper_case: bool) -> DocList[MyDoc]:
-        if upper_case == True:
-            docs.name = [n.upper() for n in docs.name]
-        else:
-            docs.name = [n.lower() for n in docs.name]
-        return docs
+    def scale(embeddings: NdArray, factor: float) -> NdArray:
+        return embeddings * factor
 
 
-    batch_size = 16
-    docs = DocList[MyDoc]([MyDoc(name='my orange cat') for _ in range(100)])
-    func_args={'upper_case': True}
-    it = _map_docs_batched_multiarg(docs, case_name, batch_size=batch_size, func_args=func_args)
-    for i, d in enumerate(it):
-        docs[i * batch_size : (i + 1) * batch_size] = d
+    docs = DocList[MyDoc]([MyDoc(embedding=np.ones(4)) for _ in range(100)])
+    it = _map_docs_batched_multiarg(
+        docs,
+        scale,
+        batch_size=16,
+        func_args={'factor': 2.0},
+        search_field='embedding',
+        embedding_type=NdArray,
+    )
+    scaled = np.concatenate(list(it))
 
-    assert len(docs) == 100
-    print(docs.name[:3])
+    assert scaled.shape == (100, 4)
+    print(scaled[0])
+    ```
 
     ---
 
     ```
-    ['MY ORANGE CAT', 'MY ORANGE CAT', 'MY ORANGE CAT']
+    [2. 2. 2. 2.]
     ```
 
     ---
@@ -261,9 +278,11 @@ def _map_docs_batched_multiarg(
     :param batch_size: Size of each generated batch (except the last one, which might
         be smaller).
     :param func_args: Arguments to be passed to function (same set of arguments will be passed to function in every minibatch)
+    :param search_field: the embedding field passed to `func`, extracted from every minibatch
+    :param embedding_type: type of the embedding: torch.Tensor, numpy.ndarray etc.
     :param shuffle: If set, shuffle the Documents before dividing into minibatches.
-    :param func: a function that takes an :class:`AnyDocArray` as input and outputs
-        an :class:`AnyDocArray` or a :class:`BaseDoc`.
+    :param func: a function that takes the embeddings of a minibatch, followed by
+        the values of `func_args`
     :param backend: `thread` for multithreading and `process` for multiprocessing.
         Defaults to `thread`.
         In general, if `func` is IO-bound then `thread` is a good choice.
@@ -286,7 +305,7 @@ def _map_docs_batched_multiarg(
     :param pool: use an existing/external pool. If given, `backend` is ignored and you will
         be responsible for closing the pool.
 
-    :return: yield DocLists returned from `func`
+    :return: yield the results of `func`
     """
     if backend == "process" and _is_lambda_or_partial_or_local_function(func):
         raise ValueError(
@@ -309,21 +328,85 @@ def _map_docs_batched_multiarg(
 
     batches = docs._batch(batch_size=batch_size, shuffle=shuffle)
     for batch in batches:
-        embs = _extract_embeddings(
-            batch, func_args['search_field'], func_args['embedding_type']
-        )
+        embs = _extract_embeddings(batch, search_field, embedding_type)
         ls = [embs]
         ls = ls + per_batch_args
 
         args_list.append(ls)
-    if __name__ == '__main__':
+    with context_pool:
+        starmap = p.starmap(func, args_list)
+        for x in track(
+            starmap, total=ceil(len(docs) / batch_size), disable=not show_progress
+        ):
+            yield x
 
-        with context_pool:
-            starmap = p.starmap(func, args_list)
-            for x in track(
-                starmap, total=ceil(len(docs) / batch_size), disable=not show_progress
-            ):
-                yield x
+
+def _map_tensor_batched(
+    tensor: Any,
+    func: Callable[..., Any],
+    batch_size: int,
+    func_args: Mapping[str, Any],
+    backend: str = "thread",
+    num_worker: Optional[int] = None,
+    shuffle: bool = False,
+    pool: Optional[Union[Pool, ThreadPool]] = None,
+    show_progress: bool = False,
+) -> Generator[Any, None, None]:
+    """
+    Return an iterator that applies `func` to every **minibatch** of rows of a tensor
+    in parallel, yielding the results.
+
+    The tensor is sliced along its first axis, so unlike
+    `_map_docs_batched_multiarg` no Documents are created.
+    `func` is called with a minibatch as first argument, followed by the values of
+    `func_args` in their order.
+
+    :param tensor: a tensor of shape (n_rows, ...), sliced into minibatches
+    :param func: a function that takes a minibatch of the tensor, followed by the
+        values of `func_args`
+    :param batch_size: Size of each generated batch (except the last one, which might
+        be smaller).
+    :param func_args: Arguments to be passed to function (same set of arguments will be passed to function in every minibatch)
+    :param backend: `thread` for multithreading and `process` for multiprocessing.
+        Defaults to `thread`.
+    :param num_worker: the number of parallel workers. If not given, then the number of CPUs
+        in the system will be used.
+    :param shuffle: If set, shuffle the rows before dividing into minibatches.
+    :param pool: use an existing/external pool. If given, `backend` is ignored and you will
+        be responsible for closing the pool.
+    :param show_progress: show a progress bar
+
+    :return: yield the results of `func`
+    """
+    if backend == "process" and _is_lambda_or_partial_or_local_function(func):
+        raise ValueError(
+            f"Multiprocessing does not allow functions that are local, lambda or partial: {func}"
+        )
+
+    context_pool: Union[nullcontext, Union[Pool, ThreadPool]]
+    if pool:
+        p = pool
+        context_pool = nullcontext()
+    else:
+        p = _get_pool(backend, num_worker)
+        context_pool = p
+
+    n_rows = tensor.shape[0]
+    per_batch_args = list(func_args.values())
+    if shuffle:
+        indices = list(range(n_rows))
+        random.shuffle(indices)
+        batches = [
+            tensor[indices[i : i + batch_size]] for i in range(0, n_rows, batch_size)
+        ]
+    else:
+        batches = [tensor[i : i + batch_size] for i in range(0, n_rows, batch_size)]
+    args_list = [[batch] + per_batch_args for batch in batches]
+
+    with context_pool:
+        starmap = p.starmap(func, args_list)
+        for x in track(starmap, total=len(args_list), disable=not show_progress):
+            yield x
 
 
 def _get_pool(backend, num_worker) -> Union[Pool, ThreadPool]:
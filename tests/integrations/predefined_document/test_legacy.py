@@ -0,0 +1,9 @@
+from docarray.documents.legacy import LegacyDocument
+
+
+def test_legacy_document_tags_not_shared():
+    doc_1 = LegacyDocument()
+    doc_2 = LegacyDocument()
+
+    doc_1.tags['price'] = 10
+    assert doc_2.tags == {}
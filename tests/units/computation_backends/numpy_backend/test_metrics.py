@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from docarray.computation.numpy_backend import NumpyCompBackend
 
@@ -20,6 +21,13 @@ def test_cosine_sim_np():
     np.testing.assert_array_almost_equal(diag_dists, np.ones((5,)))
 
 
+def test_cosine_sim_int_np():
+    a = np.array([[1, 0], [3, 4]])
+    sims = metrics.cosine_sim(a, a)
+    assert sims.dtype == np.float64
+    np.testing.assert_array_almost_equal(sims, [[1.0, 0.6], [0.6, 1.0]])
+
+
 def test_euclidean_dist_np():
     a = np.random.rand(128)
     b = np.random.rand(128)
@@ -65,3 +73,47 @@ def test_sqeuclidea_dist_np():
     np.testing.assert_array_almost_equal(
         metrics.sqeuclidean_dist(a, b), metrics.euclidean_dist(a, b) ** 2
     )
+
+
+def test_cosine_sim_topk_np():
+    a = np.random.rand(10, 3)
+    b = np.random.rand(50, 3)
+    exp_vals, exp_idx = NumpyCompBackend.Retrieval.top_k(
+        metrics.cosine_sim(a, b), k=7, descending=True
+    )
+    for tile_size in (4, 50, 4096):
+        vals, idx = metrics.cosine_sim_topk(a, b, k=7, tile_size=tile_size)
+        assert vals.shape == (10, 7)
+        assert idx.shape == (10, 7)
+        np.testing.assert_allclose(vals, exp_vals)
+        assert (idx == exp_idx).all()
+
+    vals, idx = metrics.cosine_sim_topk(a, b, k=100, descending=False, tile_size=8)
+    assert vals.shape == (10, 50)
+    assert (np.sort(vals[0]) == vals[0]).all()
+
+
+def test_cosine_sim_topk_score_dtype_np():
+    a = np.random.rand(10, 3)
+    b = np.random.rand(50, 3)
+    exp_vals, _ = metrics.cosine_sim_topk(a, b, k=7)
+    vals, _ = metrics.cosine_sim_topk(a, b, k=7, score_dtype=np.float16)
+    assert vals.dtype == np.float64
+    np.testing.assert_allclose(vals, exp_vals, atol=1e-2)
+
+
+@pytest.mark.parametrize('metric', ['euclidean_dist', 'sqeuclidean_dist'])
+def test_euclidean_dist_topk_np(metric):
+    a = np.random.rand(10, 3)
+    b = np.random.rand(50, 3)
+    exp_vals, exp_idx = NumpyCompBackend.Retrieval.top_k(
+        getattr(metrics, metric)(a, b), k=7, descending=False
+    )
+    y_norms = metrics.l2_norm(b)
+    for tile_size in (4, 50, 4096):
+        vals, idx = getattr(metrics, f'{metric}_topk')(
+            a, b, k=7, tile_size=tile_size, y_norms=y_norms
+        )
+        assert vals.shape == (10, 7)
+        np.testing.assert_allclose(vals, exp_vals, atol=1e-7)
+        assert (idx == exp_idx).all()
@@ -80,3 +80,11 @@ def test_sqeuclidean_dist_torch():
         metrics.sqeuclidean_dist(a, b).tensor,
         metrics.euclidean_dist(a, b).tensor ** 2,
     )
+
+
+@pytest.mark.tensorflow
+def test_l2_norm_tf():
+    a = TensorFlowTensor(tf.constant([[3.0, 4.0], [0.0, 0.0], [1.0, 0.0]]))
+    norms = metrics.l2_norm(a).tensor
+    assert norms.shape == (3,)
+    tf.experimental.numpy.allclose(norms, tf.constant([5.0, 0.0, 1.0]))
@@ -1,3 +1,4 @@
+import pytest
 import torch
 
 from docarray.computation.torch_backend import TorchCompBackend
@@ -63,3 +64,92 @@ def test_sqeuclidean_dist_torch():
         metrics.sqeuclidean_dist(a, b),
         metrics.euclidean_dist(a, b) ** 2,
     )
+
+
+def test_cosine_sim_topk_torch():
+    a = torch.rand(10, 3)
+    b = torch.rand(50, 3)
+    exp_vals, exp_idx = TorchCompBackend.Retrieval.top_k(
+        metrics.cosine_sim(a, b), k=7, descending=True
+    )
+    for tile_size in (4, 50, 4096):
+        vals, idx = metrics.cosine_sim_topk(a, b, k=7, tile_size=tile_size)
+        assert vals.shape == (10, 7)
+        assert idx.shape == (10, 7)
+        torch.testing.assert_close(vals, exp_vals)
+        assert (idx == exp_idx).all()
+
+    vals, idx = metrics.cosine_sim_topk(a, b, k=100, descending=False, tile_size=8)
+    assert vals.shape == (10, 50)
+    assert (torch.stack(sorted(vals[0])) == vals[0]).all()
+
+
+def test_cosine_sim_topk_score_dtype_torch():
+    a = torch.rand(10, 3)
+    b = torch.rand(50, 3)
+    exp_vals, _ = metrics.cosine_sim_topk(a, b, k=7)
+    vals, _ = metrics.cosine_sim_topk(a, b, k=7, score_dtype=torch.bfloat16)
+    assert vals.dtype == torch.float32
+    torch.testing.assert_close(vals, exp_vals, atol=1e-2, rtol=1e-2)
+
+
+def test_cosine_sim_topk_int8_torch():
+    a = torch.randn(10, 64)
+    b = torch.randn(50, 64)
+    exp_vals, _ = metrics.cosine_sim_topk(a, b, k=7)
+    vals, idx = metrics.cosine_sim_topk(a, b, k=7, score_dtype=torch.int8)
+    assert vals.dtype == torch.float32
+    torch.testing.assert_close(vals, exp_vals, atol=2e-2, rtol=2e-2)
+    # near ties may swap places, but the retrieved vectors are as similar
+    exact_vals = metrics.cosine_sim(a, b).gather(1, idx)
+    torch.testing.assert_close(exact_vals, exp_vals, atol=2e-2, rtol=2e-2)
+
+
+@pytest.mark.parametrize('metric', ['cosine_sim', 'sqeuclidean_dist'])
+def test_topk_int8_precomputed_quantization_torch(metric):
+    from docarray.computation.torch_backend import _quantize_rows
+
+    a = torch.randn(10, 64)
+    b = torch.randn(50, 64)
+    topk = getattr(metrics, f'{metric}_topk')
+    exp_vals, exp_idx = topk(a, b, k=7, score_dtype=torch.int8, tile_size=16)
+    vals, idx = topk(
+        a,
+        b,
+        k=7,
+        score_dtype=torch.int8,
+        tile_size=16,
+        y_quantized=_quantize_rows(b),
+    )
+    torch.testing.assert_close(vals, exp_vals)
+    assert (idx == exp_idx).all()
+
+
+@pytest.mark.parametrize('metric', ['euclidean_dist', 'sqeuclidean_dist'])
+def test_euclidean_dist_topk_torch(metric):
+    a = torch.rand(10, 3)
+    b = torch.rand(50, 3)
+    exp_vals, exp_idx = TorchCompBackend.Retrieval.top_k(
+        getattr(metrics, metric)(a, b), k=7, descending=False
+    )
+    y_norms = metrics.l2_norm(b)
+    for tile_size in (4, 50, 4096):
+        vals, idx = getattr(metrics, f'{metric}_topk')(
+            a, b, k=7, tile_size=tile_size, y_norms=y_norms
+        )
+        assert vals.shape == (10, 7)
+        torch.testing.assert_close(vals, exp_vals, atol=1e-5, rtol=1e-4)
+        assert (idx == exp_idx).all()
+
+
+def test_sqeuclidean_dist_topk_score_dtype_torch():
+    a = torch.rand(10, 16)
+    b = torch.rand(50, 16)
+    exp_vals, _ = metrics.sqeuclidean_dist_topk(a, b, k=7)
+    vals, _ = metrics.sqeuclidean_dist_topk(a, b, k=7, score_dtype=torch.bfloat16)
+    assert vals.dtype == torch.float32
+    torch.testing.assert_close(vals, exp_vals, atol=0.1, rtol=0.05)
+
+    vals, _ = metrics.sqeuclidean_dist_topk(a, b, k=7, score_dtype=torch.int8)
+    assert vals.dtype == torch.float32
+    torch.testing.assert_close(vals, exp_vals, atol=0.1, rtol=0.05)
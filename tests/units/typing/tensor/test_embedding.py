@@ -20,3 +20,12 @@ def test_json_schema():
 def test_dump_json():
     tensor = parse_obj_as(AnyEmbedding, np.zeros((3, 224, 224)))
     orjson_dumps(tensor)
+
+
+def test_torch_tensor_dispatches_to_torch_embedding():
+    torch = pytest.importorskip('torch')
+    from docarray.typing import TorchEmbedding
+
+    for value in [torch.zeros(3), torch.tensor(3)]:
+        embedding = parse_obj_as(AnyEmbedding, value)
+        assert isinstance(embedding, TorchEmbedding)
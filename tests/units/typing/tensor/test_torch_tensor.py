@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import torch
 from pydantic.tools import parse_obj_as, schema_json_of
@@ -13,6 +14,98 @@ def test_proto_tensor():
     tensor._to_node_protobuf()
 
 
+@pytest.mark.proto
+@pytest.mark.parametrize(
+    'dtype',
+    [
+        torch.bool,
+        torch.uint8,
+        torch.int32,
+        torch.float16,
+        torch.float64,
+        torch.complex64,
+    ],
+)
+def test_proto_round_trip(dtype):
+    tensor = parse_obj_as(TorchTensor, torch.ones(3, 4, dtype=dtype))
+
+    from_proto = TorchTensor.from_protobuf(tensor.to_protobuf())
+    assert isinstance(from_proto, TorchTensor)
+    assert from_proto.dtype == dtype
+    assert (from_proto == tensor).all()
+
+    from_proto[0, 0] = 0  # the default is a writable copy
+    assert (tensor == torch.ones(3, 4, dtype=dtype)).all()
+
+
+@pytest.mark.proto
+def test_proto_no_copy():
+    tensor = parse_obj_as(TorchTensor, torch.rand(3, 4))
+
+    from_proto = TorchTensor.from_protobuf(tensor.to_protobuf(), copy=False)
+    assert isinstance(from_proto, TorchTensor)
+    assert from_proto.shape == (3, 4)
+    assert (from_proto == tensor).all()
+
+
+@pytest.mark.proto
+def test_proto_non_native_byte_order():
+    from docarray.proto import NdArrayProto
+
+    proto = NdArrayProto()
+    proto.dense.buffer = np.arange(6, dtype='>i4').tobytes()
+    proto.dense.shape.extend([2, 3])
+    proto.dense.dtype = '>i4'
+
+    from_proto = TorchTensor.from_protobuf(proto)
+    assert (from_proto == torch.arange(6).reshape(2, 3)).all()
+
+
+def test_proto_non_contiguous():
+    tensor = parse_obj_as(TorchTensor, torch.rand(3, 4)).T
+
+    from_proto = TorchTensor.from_protobuf(tensor.to_protobuf())
+    assert from_proto.shape == (4, 3)
+    assert (from_proto == tensor).all()
+
+
+def test_validate_same_type_is_identity():
+    tensor = parse_obj_as(TorchTensor, torch.zeros(3))
+
+    assert parse_obj_as(TorchTensor, tensor) is tensor
+
+
+@pytest.mark.parametrize(
+    'tensor', [torch.rand(3, 4), torch.rand(3, 4).T, torch.rand(8)[2:5]]
+)
+def test_pickle(tensor):
+    import pickle
+
+    tensor = parse_obj_as(TorchTensor, tensor)
+
+    unpickled = pickle.loads(pickle.dumps(tensor))
+    assert isinstance(unpickled, TorchTensor)
+    assert unpickled.shape == tensor.shape
+    assert (unpickled == tensor).all()
+
+
+@pytest.mark.parametrize(
+    'tensor',
+    [
+        torch.randn(3, dtype=torch.complex64).conj(),
+        torch._neg_view(torch.randn(3, dtype=torch.complex64)),
+    ],
+)
+def test_pickle_conj_neg_bit(tensor):
+    import pickle
+
+    tensor = parse_obj_as(TorchTensor, tensor)
+
+    unpickled = pickle.loads(pickle.dumps(tensor))
+    assert isinstance(unpickled, TorchTensor)
+    assert (unpickled == tensor).all()
+
+
 def test_json_schema():
     schema_json_of(TorchTensor)
 
@@ -35,6 +128,24 @@ def test_unwrap():
     assert (ndarray == torch.zeros(3, 224, 224)).all()
 
 
+def test_validate_keeps_leaf_tensor():
+    from docarray import BaseDoc
+
+    class MyDoc(BaseDoc):
+        tensor: TorchTensor
+
+    doc = MyDoc(tensor=torch.ones(3, requires_grad=True))
+    assert doc.tensor.is_leaf
+
+    doc.tensor.sum().backward()
+    assert doc.tensor.grad is not None
+    assert (doc.tensor.grad == torch.ones(3)).all()
+
+    optimizer = torch.optim.SGD([doc.tensor], lr=1.0)
+    optimizer.step()
+    assert (doc.tensor.detach() == torch.zeros(3)).all()
+
+
 def test_parametrized_correct_axis_shape():
     # correct shape, single axis
     tensor = parse_obj_as(TorchTensor[128], torch.zeros(128))
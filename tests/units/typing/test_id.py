@@ -35,3 +35,13 @@ def test_operators(id):
     assert parsed_id != 'aljdñjd'
     assert str(id)[0:1] in parsed_id
     assert 'docarray' not in parsed_id
+
+
+def test_id_validation_is_identity_on_id():
+    parsed_id = parse_obj_as(ID, '1234')
+    assert parse_obj_as(ID, parsed_id) is parsed_id
+
+
+def test_id_validation_wrong_type():
+    with pytest.raises(ValueError):
+        parse_obj_as(ID, 12.5)
@@ -1,10 +1,11 @@
+import sys
 from typing import Optional, Union
 
 import numpy as np
 import pytest
 import torch
 
-from docarray import BaseDoc, DocList
+from docarray import BaseDoc, DocList, DocVec
 from docarray.typing import NdArray, TorchTensor
 from docarray.utils.find import find, find_batched
 
@@ -439,3 +440,287 @@ def test_find_nested_union_optional():
     assert len(top_k) == 7
     assert len(scores) == 7
     assert (torch.stack(sorted(scores, reverse=True)) == scores).all()
+
+
+def test_find_batched_stacked_index_returns_doc_list(random_torch_index):
+    query = torch.stack(random_torch_index.tensor[:3])
+    index = random_torch_index.to_doc_vec()
+
+    documents, _ = find_batched(
+        index,
+        query,
+        search_field='tensor',
+        limit=4,
+        metric='cosine_sim',
+    )
+    assert len(documents) == 3
+    for i, top_k in enumerate(documents):
+        assert isinstance(top_k, DocList)
+        assert len(top_k) == 4
+        assert torch.allclose(top_k.tensor[0], index.tensor[i])
+
+
+@pytest.mark.parametrize('batch_size', [None, 2])
+def test_find_cache_index(random_torch_index, batch_size):
+    index = random_torch_index.to_doc_vec()
+    query = DocList[TorchDoc]([TorchDoc(tensor=torch.rand(128)) for _ in range(3)])
+
+    expected, expected_scores = find_batched(
+        index, query, batch_size=batch_size, search_field='tensor', limit=4
+    )
+    for _ in range(2):
+        documents, scores = find_batched(
+            index,
+            query,
+            batch_size=batch_size,
+            search_field='tensor',
+            limit=4,
+            cache_index=True,
+        )
+        for exp, res in zip(expected_scores, scores):
+            assert torch.allclose(exp, res)
+
+    # in-place changes of the index are picked up
+    index.tensor[0] = query[0].tensor * 10
+    documents, scores = find_batched(
+        index,
+        query,
+        batch_size=batch_size,
+        search_field='tensor',
+        limit=4,
+        cache_index=True,
+    )
+    assert torch.allclose(documents[0].tensor[0], query[0].tensor * 10)
+    assert torch.allclose(scores[0][0], torch.tensor(1.0))
+
+
+def test_find_batched_limit_zero(random_torch_index, random_torch_batch_query):
+    documents, scores = find_batched(
+        random_torch_index,
+        random_torch_batch_query,
+        search_field='tensor',
+        limit=0,
+    )
+    assert len(documents) == N_QUERIES
+    assert all(len(top_k) == 0 for top_k in documents)
+
+
+@pytest.mark.parametrize('batch_size', [None, 2])
+@pytest.mark.parametrize('stack', [False, True])
+def test_find_batched_limit_larger_than_index(
+    random_nd_index, random_nd_batch_query, batch_size, stack
+):
+    index = random_nd_index.to_doc_vec() if stack else random_nd_index
+    documents, scores = find_batched(
+        index,
+        random_nd_batch_query,
+        batch_size=batch_size,
+        search_field='tensor',
+        limit=len(index) + 5,
+    )
+    assert len(documents) == len(scores) == N_QUERIES
+    for top_k, top_scores in zip(documents, scores):
+        assert len(top_k) == len(top_scores) == len(index)
+        assert isinstance(top_k, DocList)
+
+
+@pytest.mark.parametrize('stack', [False, True])
+def test_find_limit_zero(random_torch_index, random_torch_query, stack):
+    index = random_torch_index.to_doc_vec() if stack else random_torch_index
+    top_k, scores = find(
+        index,
+        random_torch_query,
+        search_field='tensor',
+        limit=0,
+    )
+    assert len(top_k) == 0
+    assert len(scores) == 0
+
+
+@pytest.mark.parametrize('stack', [False, True])
+def test_find_batched_auto_chunks(random_nd_index, stack):
+    index = random_nd_index.to_doc_vec() if stack else random_nd_index
+    query = np.random.rand(50, 128)
+
+    expected, expected_scores = find_batched(
+        index, query, search_field='tensor', limit=3, num_worker=1
+    )
+    # more than two queries per worker, so the queries are split into chunks
+    documents, scores = find_batched(
+        index, query, search_field='tensor', limit=3, num_worker=4
+    )
+    assert len(documents) == len(scores) == 50
+    for exp, res in zip(expected, documents):
+        assert np.allclose(np.stack(exp.tensor), np.stack(res.tensor))
+    for exp, res in zip(expected_scores, scores):
+        assert np.allclose(exp, res)
+
+
+def test_find_batched_auto_chunks_pool(monkeypatch, random_nd_index):
+    from multiprocessing.pool import Pool, ThreadPool
+
+    import docarray.utils.find as find_module
+
+    chunk_sizes = []
+    orig_find_chunked = find_module._find_chunked
+
+    def find_chunked(index, query_embs, chunk_size, *args):
+        chunk_sizes.append(chunk_size)
+        return orig_find_chunked(index, query_embs, chunk_size, *args)
+
+    monkeypatch.setattr(find_module, '_find_chunked', find_chunked)
+    query = np.random.rand(50, 128)
+
+    # the chunks are sized for the threads of the pool, not for `num_worker`
+    with ThreadPool(processes=2) as pool:
+        documents, _ = find_batched(
+            random_nd_index, query, search_field='tensor', num_worker=5, pool=pool
+        )
+    assert len(documents) == 50
+    assert chunk_sizes == [25]
+
+    # a process pool searches all queries in one go
+    with Pool(processes=2) as pool:
+        documents, _ = find_batched(
+            random_nd_index, query, search_field='tensor', pool=pool
+        )
+    assert len(documents) == 50
+    assert chunk_sizes == [25]
+
+
+def test_find_batched_no_auto_chunks_torch(monkeypatch, random_torch_index):
+    import docarray.utils.find as find_module
+
+    def find_chunked(*args):
+        raise AssertionError('PyTorch queries are not chunked')
+
+    monkeypatch.setattr(find_module, '_find_chunked', find_chunked)
+    documents, scores = find_batched(
+        random_torch_index, torch.rand(50, 128), search_field='tensor', num_worker=4
+    )
+    assert len(documents) == len(scores) == 50
+
+
+def test_find_cache_index_int8(monkeypatch, random_torch_index):
+    import docarray.computation.torch_backend as torch_backend
+
+    n_quantized = []
+    orig_quantize_rows = torch_backend._quantize_rows
+
+    def quantize_rows(mat):
+        n_quantized.append(mat.shape[0])
+        return orig_quantize_rows(mat)
+
+    monkeypatch.setattr(torch_backend, '_quantize_rows', quantize_rows)
+    index = random_torch_index.to_doc_vec()
+    query = index.tensor[3]
+    for _ in range(2):
+        top_k, scores = find(
+            index,
+            query,
+            search_field='tensor',
+            score_dtype=torch.int8,
+            cache_index=True,
+        )
+        assert top_k[0].id == index[3].id
+        assert torch.allclose(scores[0], torch.tensor(1.0), atol=1e-2)
+    # the index is quantized once, the query once per search
+    assert n_quantized == [len(index), 1, 1]
+
+    # in-place changes of the index are picked up
+    index.tensor[0] = query
+    find(index, query, search_field='tensor', score_dtype=torch.int8, cache_index=True)
+    assert n_quantized[-2:] == [len(index), 1]
+
+
+def test_find_cache_index_doc_list(random_nd_index):
+    query = random_nd_index[3].tensor
+    top_k, _ = find(random_nd_index, query, search_field='tensor', cache_index=True)
+    assert top_k[0].id == random_nd_index[3].id
+
+    # replaced embeddings and new Documents are picked up
+    random_nd_index[0].tensor = query * 2
+    random_nd_index.append(NdDoc(tensor=query * 3))
+    top_k, scores = find(
+        random_nd_index,
+        query,
+        search_field='tensor',
+        metric='euclidean_dist',
+        limit=11,
+        cache_index=True,
+    )
+    assert len(top_k) == 11
+    assert top_k[0].id == random_nd_index[3].id
+    assert np.allclose(scores[0], 0.0, atol=1e-5)
+
+
+def test_find_unknown_metric(random_nd_query, random_nd_index):
+    with pytest.raises(ValueError, match='Unknown metric'):
+        find(random_nd_index, random_nd_query, search_field='tensor', metric='dot')
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_find_batched_tensor_query_per_batch(random_torch_index, backend):
+    query = torch.rand(5, 128)
+    documents, scores = find_batched(
+        random_torch_index,
+        query,
+        batch_size=2,
+        search_field='tensor',
+        limit=3,
+        backend=backend,
+        show_progress=True,
+    )
+    exp_documents, exp_scores = find_batched(
+        random_torch_index, query, search_field='tensor', limit=3
+    )
+    assert len(documents) == len(scores) == 5
+    for top_k, exp_top_k in zip(documents, exp_documents):
+        assert top_k.id == exp_top_k.id
+    for score, exp_score in zip(scores, exp_scores):
+        assert torch.allclose(score, exp_score)
+
+
+def test_find_batched_respects_batch_size(monkeypatch, random_nd_index):
+    import docarray.utils.find as find_module
+
+    batch_sizes = []
+    orig_get_result = find_module.get_result
+
+    def get_result(query_embeds, *args):
+        batch_sizes.append(query_embeds.shape[0])
+        return orig_get_result(query_embeds, *args)
+
+    monkeypatch.setattr(find_module, 'get_result', get_result)
+    documents, _ = find_batched(
+        random_nd_index,
+        np.random.rand(50, 128),
+        batch_size=4,
+        search_field='tensor',
+        limit=3,
+        num_worker=4,
+    )
+    assert len(documents) == 50
+    assert max(batch_sizes) == 4
+
+
+def test_find_batched_process_without_shared_memory(
+    monkeypatch, random_nd_index, random_nd_batch_query
+):
+    # shared memory is only available from Python 3.8 on
+    monkeypatch.setitem(sys.modules, 'multiprocessing.shared_memory', None)
+    documents, scores = find_batched(
+        random_nd_index,
+        random_nd_batch_query,
+        batch_size=2,
+        search_field='tensor',
+        limit=3,
+        backend='process',
+    )
+    exp_documents, exp_scores = find_batched(
+        random_nd_index, random_nd_batch_query, search_field='tensor', limit=3
+    )
+    for top_k, exp_top_k in zip(documents, exp_documents):
+        assert top_k.id == exp_top_k.id
+    for score, exp_score in zip(scores, exp_scores):
+        assert np.allclose(score, exp_score)